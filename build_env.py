@@ -0,0 +1,145 @@
+import os
+import sys
+import json
+import shutil
+import hashlib
+import threading
+import subprocess
+
+from fleet_upgrade import venv_python, is_venv
+from telemetry import track
+
+
+# Where the build environment lives inside a project (build/ is already git-ignored)
+BUILD_ENV_DIR = os.path.join('build', 'buildenv')
+FINGERPRINT_FILE = 'buildenv.json'
+
+# Always layered on top of the project's requirements
+BUILD_PACKAGES = ('pyinstaller',)
+
+_env_lock = threading.Lock()
+
+
+def find_project_root(entry_script):
+    """The nearest folder above entry_script with a venv/ or requirements.txt, else the script's folder."""
+    start = os.path.dirname(os.path.abspath(entry_script))
+    path = start
+    while True:
+        if is_venv(os.path.join(path, 'venv')) or os.path.isfile(os.path.join(path, 'requirements.txt')):
+            return path
+        parent = os.path.dirname(path)
+        if parent == path:
+            return start
+        path = parent
+
+
+def base_python(project_dir):
+    """The interpreter build environments are derived from: the project venv's, else this one."""
+    venv_dir = os.path.join(project_dir, 'venv')
+    if is_venv(venv_dir) and os.path.isfile(venv_python(venv_dir)):
+        return venv_python(venv_dir)
+    return sys.executable
+
+
+def _requirement_lines(requirements_path):
+    try:
+        with open(requirements_path, encoding='utf-8') as f:
+            return [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+    except FileNotFoundError:
+        return []
+
+
+def _interpreter_id(project_dir):
+    # pyvenv.cfg names the base interpreter and its version, so no subprocess is needed
+    cfg = os.path.join(project_dir, 'venv', 'pyvenv.cfg')
+    try:
+        with open(cfg, encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return f"{os.path.realpath(sys.executable)} {sys.version}"
+
+
+def fingerprint(project_dir, packages=BUILD_PACKAGES):
+    """Hash of everything the build environment depends on: requirements, interpreter, build tools."""
+    digest = hashlib.sha256()
+    try:
+        with open(os.path.join(project_dir, 'requirements.txt'), 'rb') as f:
+            digest.update(f.read())
+    except FileNotFoundError:
+        pass
+    digest.update(b'\0' + _interpreter_id(project_dir).encode('utf-8'))
+    digest.update(b'\0' + ' '.join(packages).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _stored_fingerprint(env_dir):
+    try:
+        with open(os.path.join(env_dir, FINGERPRINT_FILE), encoding='utf-8') as f:
+            return json.load(f).get('fingerprint')
+    except (OSError, ValueError):
+        return None
+
+
+def _run(cmd, on_output, timeout):
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    # reading stdout blocks until the process closes it, so a hung install is killed
+    # by a watchdog rather than by wait(timeout), which would only start at EOF
+    expired = threading.Event()
+
+    def expire():
+        expired.set()
+        proc.kill()
+
+    watchdog = threading.Timer(timeout, expire)
+    watchdog.start()
+    try:
+        for line in proc.stdout:
+            on_output(line.rstrip())
+        proc.wait()
+    except BaseException:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        watchdog.cancel()
+    if expired.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+def ensure_build_env(project_dir, packages=BUILD_PACKAGES, on_output=None, timeout=1800):
+    """
+    Return (python, rebuilt) for the project's isolated build environment.
+
+    The environment is a separate venv made from the project venv's interpreter with
+    the project's requirements.txt and the build packages installed, so bundles get
+    exactly the project's dependencies. It is reused as long as its fingerprint
+    (requirements, interpreter, packages) matches and rebuilt from scratch otherwise.
+    The fingerprint is written last, so an interrupted build is redone next time.
+    """
+    on_output = on_output or (lambda line: None)
+    project_dir = os.path.abspath(project_dir)
+    env_dir = os.path.join(project_dir, BUILD_ENV_DIR)
+    python = venv_python(env_dir)
+    wanted = fingerprint(project_dir, packages)
+    with _env_lock:
+        if _stored_fingerprint(env_dir) == wanted and os.path.isfile(python):
+            return python, False
+        requirements = os.path.join(project_dir, 'requirements.txt')
+        install = list(packages)
+        if _requirement_lines(requirements):
+            install += ['-r', requirements]
+        with track('build_env', {'project_dir': project_dir, 'packages': list(packages)}) as record:
+            shutil.rmtree(env_dir, ignore_errors=True)
+            on_output(f"Creating build environment in {env_dir}")
+            _run([base_python(project_dir), '-m', 'venv', env_dir] + ([] if install else ['--without-pip']),
+                 on_output, timeout)
+            record.subprocesses += 1
+            if install:
+                _run([python, '-m', 'pip', 'install', '--disable-pip-version-check'] + install,
+                     on_output, timeout)
+                record.subprocesses += 1
+            with open(os.path.join(env_dir, FINGERPRINT_FILE), 'w', encoding='utf-8') as f:
+                json.dump({'fingerprint': wanted, 'packages': list(packages)}, f)
+        return python, True
@@ -0,0 +1,131 @@
+import os
+import sys
+import json
+import time
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+# Folders never worth descending into while looking for project venvs
+SKIP_DIRS = {'.git', 'node_modules', '__pycache__', 'build', 'dist', 'site-packages'}
+
+
+def venv_python(venv_dir):
+    """Return the interpreter inside a virtual environment."""
+    if sys.platform.startswith("win"):
+        return os.path.join(venv_dir, 'Scripts', 'python.exe')
+    return os.path.join(venv_dir, 'bin', 'python')
+
+
+def is_venv(path):
+    return os.path.isfile(os.path.join(path, 'pyvenv.cfg'))
+
+
+def find_project_venvs(root, max_depth=3):
+    """
+    Find virtual environments under root, e.g. the venv/ folders that
+    scaffold_project creates. A venv is never searched further once found.
+    """
+    found = []
+    root = os.path.abspath(root)
+    base_depth = root.rstrip(os.sep).count(os.sep)
+    for dirpath, dirnames, _ in os.walk(root):
+        if is_venv(dirpath):
+            found.append(dirpath)
+            dirnames[:] = []
+            continue
+        if dirpath.count(os.sep) - base_depth >= max_depth:
+            dirnames[:] = []
+            continue
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS and not d.startswith('.')]
+    return sorted(found)
+
+
+def venvs_for_projects(project_paths):
+    """Map a list of project folders to the venv/ each one contains, skipping those without one."""
+    venvs = []
+    for path in project_paths:
+        venv_dir = os.path.join(path, 'venv')
+        if is_venv(venv_dir):
+            venvs.append(os.path.abspath(venv_dir))
+    return venvs
+
+
+def upgrade_venv(venv_dir, packages=None, dry_run=False, timeout=900):
+    """
+    Upgrade the outdated packages of one venv and return a report dict.
+
+    packages: only upgrade these names (e.g. a single security fix); None means all outdated.
+    All upgrades go through a single pip install so the resolver runs once per venv.
+    """
+    python = venv_python(venv_dir)
+    report = {'venv': venv_dir, 'outdated': [], 'upgraded': [], 'error': None, 'duration': 0.0}
+    start = time.monotonic()
+    try:
+        if not os.path.isfile(python):
+            raise FileNotFoundError(f"No interpreter at {python}")
+        listing = subprocess.run(
+            [python, '-m', 'pip', 'list', '--outdated', '--format=json', '--disable-pip-version-check'],
+            capture_output=True, text=True, timeout=timeout
+        )
+        if listing.returncode != 0:
+            raise RuntimeError(listing.stderr.strip() or f"pip list exited with {listing.returncode}")
+        outdated = json.loads(listing.stdout or '[]')
+        if packages:
+            wanted = {p.lower() for p in packages}
+            outdated = [p for p in outdated if p['name'].lower() in wanted]
+        report['outdated'] = [
+            {'name': p['name'], 'version': p['version'], 'latest': p['latest_version']} for p in outdated
+        ]
+        if outdated and not dry_run:
+            names = [p['name'] for p in outdated]
+            install = subprocess.run(
+                [python, '-m', 'pip', 'install', '--upgrade', '--disable-pip-version-check', *names],
+                capture_output=True, text=True, timeout=timeout
+            )
+            if install.returncode != 0:
+                raise RuntimeError(install.stderr.strip().splitlines()[-1] if install.stderr.strip()
+                                   else f"pip install exited with {install.returncode}")
+            report['upgraded'] = names
+    except Exception as e:
+        report['error'] = str(e)
+    report['duration'] = time.monotonic() - start
+    return report
+
+
+def upgrade_fleet(venv_dirs, packages=None, dry_run=False, max_workers=None, on_result=None):
+    """
+    Upgrade many venvs concurrently, one worker per venv.
+
+    The real work happens in the pip child processes, so a thread pool is enough
+    to keep max_workers of them running at once. on_result(report) is called as
+    each venv finishes. Returns the reports in the order of venv_dirs.
+    """
+    if not venv_dirs:
+        return []
+    max_workers = max_workers or min(8, os.cpu_count() or 1)
+    reports = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(upgrade_venv, v, packages, dry_run): v for v in venv_dirs}
+        for future in as_completed(futures):
+            report = future.result()
+            reports[futures[future]] = report
+            if on_result:
+                on_result(report)
+    return [reports[v] for v in venv_dirs]
+
+
+def format_fleet_report(reports):
+    """Render a combined, human-readable summary of upgrade_fleet results."""
+    failed = [r for r in reports if r['error']]
+    changed = [r for r in reports if r['upgraded']]
+    lines = [f"Fleet upgrade: {len(reports)} venv(s), {len(changed)} upgraded, "
+             f"{len(reports) - len(changed) - len(failed)} up-to-date, {len(failed)} failed"]
+    for r in reports:
+        if r['error']:
+            lines.append(f"  FAILED {r['venv']}: {r['error']}")
+        elif r['outdated']:
+            pkgs = ", ".join(f"{p['name']} {p['version']} -> {p['latest']}" for p in r['outdated'])
+            verb = "upgraded" if r['upgraded'] else "outdated"
+            lines.append(f"  {verb} {r['venv']} ({r['duration']:.1f}s): {pkgs}")
+    return "\n".join(lines)
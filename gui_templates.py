@@ -0,0 +1,490 @@
+import textwrap
+
+
+# Shared, framework-agnostic background-work module written next to main.py.
+# Every responsive front end below drives it the same way and only differs in
+# how it hands callbacks back to its GUI thread (the `deliver` function).
+WORKERS_MODULE = textwrap.dedent('''
+    """
+    Background work for the UI: a worker pool plus an optional asyncio loop.
+
+    Nothing in here touches the GUI. Progress and results come back through the
+    `deliver(callback, *args)` function given to TaskRunner, which each front end
+    implements so that callback runs on its GUI thread.
+    """
+    import asyncio
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+
+    class TaskRunner:
+        """
+        Run blocking functions on worker threads and coroutines on an asyncio loop.
+
+        start: how to run a job on a worker (e.g. QThreadPool.globalInstance().start);
+        defaults to a ThreadPoolExecutor with max_workers threads.
+        """
+
+        def __init__(self, deliver, start=None, max_workers=4, use_asyncio=False):
+            self._deliver = deliver
+            self._pool = None
+            if start is None:
+                self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='worker')
+                start = self._pool.submit
+            self._start = start
+            self._loop = None
+            if use_asyncio:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name='asyncio', daemon=True).start()
+
+        def _reporter(self, on_progress):
+            if on_progress is None:
+                return None
+            return lambda value: self._deliver(on_progress, value)
+
+        def submit(self, fn, *args, on_progress=None, on_done=None):
+            """Call fn(*args, report=...) on a worker; on_done(result, error) runs on the GUI thread."""
+            report = self._reporter(on_progress)
+
+            def job():
+                try:
+                    result, error = fn(*args, report=report), None
+                except Exception as e:
+                    result, error = None, e
+                if on_done:
+                    self._deliver(on_done, result, error)
+
+            self._start(job)
+
+        def submit_async(self, coro_fn, *args, on_progress=None, on_done=None):
+            """Schedule coro_fn(*args, report=...) on the asyncio loop thread."""
+            if self._loop is None:
+                raise RuntimeError("TaskRunner was created without use_asyncio=True")
+            report = self._reporter(on_progress)
+            future = asyncio.run_coroutine_threadsafe(coro_fn(*args, report=report), self._loop)
+
+            def finished(f):
+                if on_done is None:
+                    return
+                if f.cancelled():
+                    self._deliver(on_done, None, asyncio.CancelledError())
+                else:
+                    error = f.exception()
+                    self._deliver(on_done, None if error else f.result(), error)
+
+            future.add_done_callback(finished)
+            return future
+
+        def shutdown(self):
+            if self._pool:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+            if self._loop:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+
+
+    def long_task(steps=50, delay=0.05, report=None):
+        """Sample blocking job (think file I/O or a network call) that reports progress."""
+        for i in range(steps):
+            time.sleep(delay)
+            if report:
+                report((i + 1) / steps)
+        return f"Finished {steps} steps"
+
+
+    async def long_async_task(steps=50, delay=0.05, report=None):
+        """The same job written as a coroutine for the asyncio loop."""
+        for i in range(steps):
+            await asyncio.sleep(delay)
+            if report:
+                report((i + 1) / steps)
+        return f"Finished {steps} async steps"
+''').lstrip()
+
+# Tests for workers.py, written into tests/ when the project includes tests
+WORKERS_TEST = textwrap.dedent('''
+    import threading
+
+    from workers import TaskRunner, long_task, long_async_task
+
+
+    def run_and_wait(submit, **kwargs):
+        done = threading.Event()
+        calls = []
+
+        def deliver(callback, *args):
+            calls.append((callback.__name__, args))
+            callback(*args)
+
+        def on_done(result, error):
+            done.set()
+
+        runner = TaskRunner(deliver, **kwargs)
+        submit(runner, on_progress=lambda value: None, on_done=on_done)
+        assert done.wait(10)
+        runner.shutdown()
+        return calls
+
+
+    def test_long_task_reports_progress_and_result():
+        calls = run_and_wait(lambda r, **kw: r.submit(long_task, 5, 0.0, **kw))
+        assert calls[-1][1] == ("Finished 5 steps", None)
+        assert len(calls) == 6
+
+
+    def test_async_task_runs_on_loop():
+        calls = run_and_wait(lambda r, **kw: r.submit_async(long_async_task, 3, 0.0, **kw), use_asyncio=True)
+        assert calls[-1][1] == ("Finished 3 async steps", None)
+''').lstrip()
+
+
+def _tk_responsive_main(project_name, use_asyncio):
+    async_import = ", long_async_task" if use_asyncio else ""
+    async_button = textwrap.indent(textwrap.dedent('''
+        self.async_button = ttk.Button(root, text="Run async task", command=self.start_async_task)
+        self.async_button.pack(pady=(0, 20))
+    ''').lstrip('\n'), ' ' * 8) if use_asyncio else ""
+    async_method = textwrap.indent(textwrap.dedent('''
+        def start_async_task(self):
+            self.status.config(text="Working (asyncio)…")
+            self.runner.submit_async(long_async_task, on_progress=self.on_progress, on_done=self.on_done)
+    '''), ' ' * 4) if use_asyncio else ""
+    return textwrap.dedent(f'''
+        import queue
+        import tkinter as tk
+        from tkinter import ttk
+
+        from workers import TaskRunner, long_task{async_import}
+
+
+        class MainWindow:
+            """Keeps the Tk thread free: work runs in TaskRunner, results come back through a queue."""
+
+            POLL_MS = 50
+
+            def __init__(self, root):
+                self.root = root
+                root.title("{project_name}")
+                # worker threads never touch Tk; they queue callbacks that the Tk thread drains
+                self._callbacks = queue.Queue()
+                self.runner = TaskRunner(lambda callback, *args: self._callbacks.put((callback, args)),
+                                         use_asyncio={use_asyncio})
+
+                ttk.Label(root, text="Welcome to {project_name}!").pack(padx=20, pady=(20, 10))
+                self.progress = ttk.Progressbar(root, maximum=1.0, length=250)
+                self.progress.pack(padx=20)
+                self.status = ttk.Label(root, text="Idle")
+                self.status.pack(pady=5)
+                self.start_button = ttk.Button(root, text="Run long task", command=self.start_task)
+                self.start_button.pack(pady=(0, 10))
+        {{async_button}}
+                root.protocol("WM_DELETE_WINDOW", self.close)
+                root.after(self.POLL_MS, self._drain_callbacks)
+
+            def _drain_callbacks(self):
+                while True:
+                    try:
+                        callback, args = self._callbacks.get_nowait()
+                    except queue.Empty:
+                        break
+                    callback(*args)
+                self.root.after(self.POLL_MS, self._drain_callbacks)
+
+            def start_task(self):
+                self.start_button.state(['disabled'])
+                self.status.config(text="Working…")
+                self.runner.submit(long_task, on_progress=self.on_progress, on_done=self.on_done)
+        {{async_method}}
+
+            def on_progress(self, fraction):
+                self.progress['value'] = fraction
+
+            def on_done(self, result, error):
+                self.start_button.state(['!disabled'])
+                self.status.config(text=f"Error: {{error}}" if error else result)
+
+            def close(self):
+                self.runner.shutdown()
+                self.root.destroy()
+
+
+        def main():
+            root = tk.Tk()
+            MainWindow(root)
+            root.mainloop()
+
+
+        if __name__ == '__main__':
+            main()
+    ''').replace("{async_button}\n", async_button).replace("{async_method}\n", async_method)
+
+
+def _qt_responsive_main(project_name, qt, exec_call, use_asyncio):
+    async_import = ", long_async_task" if use_asyncio else ""
+    async_button = textwrap.indent(textwrap.dedent('''
+        self.async_button = QPushButton("Run async task")
+        self.async_button.clicked.connect(self.start_async_task)
+        layout.addWidget(self.async_button)
+    ''').lstrip('\n'), ' ' * 8) if use_asyncio else ""
+    async_method = textwrap.indent(textwrap.dedent('''
+        def start_async_task(self):
+            self.status.setText("Working (asyncio)…")
+            self.runner.submit_async(long_async_task, on_progress=self.on_progress, on_done=self.on_done)
+    '''), ' ' * 4) if use_asyncio else ""
+    return textwrap.dedent(f'''
+        import sys
+
+        from {qt}.QtCore import QObject, QThreadPool, pyqtSignal, pyqtSlot
+        from {qt}.QtWidgets import QApplication, QLabel, QProgressBar, QPushButton, QVBoxLayout, QWidget
+
+        from workers import TaskRunner, long_task{async_import}
+
+
+        class UiBridge(QObject):
+            """Signals emitted from worker threads are queued and their slot runs on the GUI thread."""
+
+            call = pyqtSignal(object, object)
+
+            def __init__(self):
+                super().__init__()
+                self.call.connect(self._run)
+
+            @pyqtSlot(object, object)
+            def _run(self, callback, args):
+                callback(*args)
+
+            def deliver(self, callback, *args):
+                self.call.emit(callback, args)
+
+
+        class MainWindow(QWidget):
+            """Keeps the GUI thread free: work runs on QThreadPool, results come back through signals."""
+
+            def __init__(self):
+                super().__init__()
+                self.setWindowTitle("{project_name}")
+                self.bridge = UiBridge()
+                self.runner = TaskRunner(self.bridge.deliver, start=QThreadPool.globalInstance().start,
+                                         use_asyncio={use_asyncio})
+
+                layout = QVBoxLayout()
+                layout.addWidget(QLabel("Welcome to {project_name}!"))
+                self.progress = QProgressBar()
+                self.progress.setRange(0, 100)
+                layout.addWidget(self.progress)
+                self.status = QLabel("Idle")
+                layout.addWidget(self.status)
+                self.start_button = QPushButton("Run long task")
+                self.start_button.clicked.connect(self.start_task)
+                layout.addWidget(self.start_button)
+        {{async_button}}
+                self.setLayout(layout)
+
+            def start_task(self):
+                self.start_button.setEnabled(False)
+                self.status.setText("Working…")
+                self.runner.submit(long_task, on_progress=self.on_progress, on_done=self.on_done)
+        {{async_method}}
+
+            def on_progress(self, fraction):
+                self.progress.setValue(int(fraction * 100))
+
+            def on_done(self, result, error):
+                self.start_button.setEnabled(True)
+                self.status.setText(f"Error: {{error}}" if error else result)
+
+            def closeEvent(self, event):
+                self.runner.shutdown()
+                QThreadPool.globalInstance().waitForDone(2000)
+                super().closeEvent(event)
+
+
+        def main():
+            app = QApplication(sys.argv)
+            window = MainWindow()
+            window.show()
+            sys.exit(app.{exec_call}())
+
+
+        if __name__ == '__main__':
+            main()
+    ''').replace("{async_button}\n", async_button).replace("{async_method}\n", async_method)
+
+
+def render_responsive_main(gui_lib, project_name, use_asyncio=False):
+    """
+    main.py for the responsive skeleton: the same window (progress bar, status,
+    start button) and the same workers.TaskRunner for every framework.
+    """
+    gui_lib = gui_lib.lower()
+    if gui_lib == 'tkinter':
+        source = _tk_responsive_main(project_name, use_asyncio)
+    elif gui_lib == 'pyqt5':
+        source = _qt_responsive_main(project_name, 'PyQt5', 'exec_', use_asyncio)
+    else:  # pyqt6
+        source = _qt_responsive_main(project_name, 'PyQt6', 'exec', use_asyncio)
+    return source.lstrip()
+
+
+# Lazy-import helper written next to main.py by the fast-start option
+LAZY_IMPORT_MODULE = textwrap.dedent('''
+    """
+    Deferred imports for fast startup.
+
+    lazy_import(name) returns the module object straight away but only executes the
+    module the first time one of its attributes is used, so heavy dependencies can
+    be named at the top of a file without slowing down the first window.
+    load_now(module) executes a lazily imported module ahead of its first use.
+    """
+    import importlib.util
+    import sys
+
+
+    def lazy_import(name):
+        if name in sys.modules:
+            return sys.modules[name]
+        spec = importlib.util.find_spec(name)
+        if spec is None:
+            raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+        loader = importlib.util.LazyLoader(spec.loader)
+        spec.loader = loader
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        loader.exec_module(module)
+        return module
+
+
+    def load_now(module):
+        module.__dict__  # any attribute access runs the module; a no-op once it has run
+        return module
+''').lstrip()
+
+
+def render_import_budget_test(budget_ms):
+    """tests/test_import_time.py: fails when importing main.py exceeds budget_ms."""
+    return textwrap.dedent(f'''
+        import os
+        import subprocess
+        import sys
+
+        # Budget for `import main` in a fresh interpreter; override with IMPORT_BUDGET_MS
+        IMPORT_BUDGET_MS = float(os.environ.get('IMPORT_BUDGET_MS', {budget_ms}))
+        PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        PROBE = "import time; t = time.perf_counter(); import main; print((time.perf_counter() - t) * 1000)"
+
+
+        def measure_import_ms():
+            out = subprocess.check_output([sys.executable, '-c', PROBE], cwd=PROJECT_ROOT, text=True)
+            return float(out.strip().splitlines()[-1])
+
+
+        def test_main_import_within_budget():
+            # best of three, so one slow run on a busy machine does not fail the build
+            best = min(measure_import_ms() for _ in range(3))
+            assert best <= IMPORT_BUDGET_MS, \\
+                f"import main took {{best:.0f}} ms, budget is {{IMPORT_BUDGET_MS:.0f}} ms"
+    ''').lstrip()
+
+
+def _tk_fast_main(project_name):
+    return textwrap.dedent(f'''
+        from lazy_import import lazy_import, load_now
+
+        # Heavy modules the app needs only once the window is up (json stands in for e.g.
+        # pandas). lazy_import binds them without running them, so they cost nothing at
+        # startup; load_deferred() runs them after the first paint, or first use does.
+        json = lazy_import('json')
+        DEFERRED_MODULES = [json]
+
+        # Delay after the window is mapped, so Tk has drawn it before the deferred imports
+        DEFER_MS = 50
+
+
+        def load_deferred():
+            for module in DEFERRED_MODULES:
+                load_now(module)
+
+
+        def main():
+            # tkinter is imported here, not at module level, so `import main` stays cheap
+            import tkinter as tk
+
+            root = tk.Tk()
+            root.title("{project_name}")
+            label = tk.Label(root, text="Welcome to {project_name}!")
+            label.pack(padx=20, pady=20)
+
+            def on_first_map(event):
+                if event.widget is not root:
+                    return  # child widgets' <Map> events bubble up to the root binding too
+                root.unbind('<Map>', binding)
+                # flush Tk's pending redraws, then give the window manager a moment to show them
+                root.update_idletasks()
+                root.after(DEFER_MS, load_deferred)
+
+            binding = root.bind('<Map>', on_first_map)
+            root.mainloop()
+
+
+        if __name__ == '__main__':
+            main()
+    ''').lstrip()
+
+
+def _qt_fast_main(project_name, qt, exec_call):
+    return textwrap.dedent(f'''
+        import sys
+
+        from lazy_import import lazy_import, load_now
+
+        # Heavy modules the app needs only once the window is up (json stands in for e.g.
+        # {qt}.QtWebEngineWidgets). lazy_import binds them without running them, so they cost
+        # nothing at startup; load_deferred() runs them after the first paint, or first use does.
+        json = lazy_import('json')
+        DEFERRED_MODULES = [json]
+
+
+        def load_deferred():
+            for module in DEFERRED_MODULES:
+                load_now(module)
+
+
+        def main():
+            # Only what the first window needs, imported here so `import main` stays cheap
+            from {qt}.QtCore import QTimer
+            from {qt}.QtWidgets import QApplication, QLabel, QVBoxLayout, QWidget
+
+            class MainWindow(QWidget):
+                painted = False
+
+                def paintEvent(self, event):
+                    super().paintEvent(event)
+                    if not self.painted:
+                        # the first frame is on screen once this paint returns
+                        self.painted = True
+                        QTimer.singleShot(0, load_deferred)
+
+            app = QApplication(sys.argv)
+            window = MainWindow()
+            window.setWindowTitle("{project_name}")
+            layout = QVBoxLayout()
+            label = QLabel("Welcome to {project_name}!")
+            layout.addWidget(label)
+            window.setLayout(layout)
+            window.show()
+            sys.exit(app.{exec_call}())
+
+
+        if __name__ == '__main__':
+            main()
+    ''').lstrip()
+
+
+def render_fast_start_main(gui_lib, project_name):
+    """main.py for the fast-start option: nothing heavy at import time, the rest after first paint."""
+    gui_lib = gui_lib.lower()
+    if gui_lib == 'tkinter':
+        return _tk_fast_main(project_name)
+    elif gui_lib == 'pyqt5':
+        return _qt_fast_main(project_name, 'PyQt5', 'exec_')
+    return _qt_fast_main(project_name, 'PyQt6', 'exec')
@@ -0,0 +1,255 @@
+import os
+import threading
+from collections import deque
+from itertools import islice
+import tkinter as tk
+from tkinter import ttk
+from tkinter import font as tkfont
+
+
+# Spill files for the Log and Terminal panes live next to the window-size config
+LOG_DIR = os.path.expanduser("~/.scaffolder_logs")
+
+
+class SpillingLogBuffer:
+    """
+    Keeps the newest max_lines lines in memory; older lines are appended to a
+    rotating spill file so the full history stays searchable without growing RAM.
+
+    Lines are numbered from 0 for the lifetime of the buffer (until clear()).
+    Safe to append from worker threads.
+    """
+
+    def __init__(self, spill_path, max_lines=5000, max_spill_bytes=10 * 1024 * 1024, backups=3):
+        self.spill_path = spill_path
+        self.max_lines = max_lines
+        self.max_spill_bytes = max_spill_bytes
+        self.backups = backups
+        self._lines = deque()
+        self._first = 0  # line number of self._lines[0]
+        self._lock = threading.Lock()
+        self._spill = None
+        os.makedirs(os.path.dirname(spill_path) or '.', exist_ok=True)
+        # a previous session's history becomes the first backup
+        if os.path.exists(spill_path) and os.path.getsize(spill_path):
+            self._rotate()
+
+    def __len__(self):
+        """Total number of lines ever appended (in memory plus spilled)."""
+        with self._lock:
+            return self._first + len(self._lines)
+
+    @property
+    def first_in_memory(self):
+        with self._lock:
+            return self._first
+
+    def append(self, line):
+        with self._lock:
+            for part in line.split('\n'):
+                self._lines.append(part)
+            while len(self._lines) > self.max_lines:
+                self._write_spill(self._lines.popleft())
+                self._first += 1
+
+    def get_range(self, start, count):
+        """Lines start..start+count that are still in memory."""
+        with self._lock:
+            lo = max(start, self._first)
+            hi = min(start + count, self._first + len(self._lines))
+            if hi <= lo:
+                return []
+            return list(islice(self._lines, lo - self._first, hi - self._first))
+
+    def _write_spill(self, line):
+        if self._spill is None:
+            self._spill = open(self.spill_path, 'a', encoding='utf-8')
+        self._spill.write(line + '\n')
+        if self._spill.tell() >= self.max_spill_bytes:
+            self._spill.close()
+            self._spill = None
+            self._rotate()
+
+    def _spill_files(self):
+        """Spill files from oldest to newest."""
+        names = [f"{self.spill_path}.{i}" for i in range(self.backups, 0, -1)] + [self.spill_path]
+        return [n for n in names if os.path.exists(n)]
+
+    def _rotate(self):
+        for i in range(self.backups, 0, -1):
+            src = self.spill_path if i == 1 else f"{self.spill_path}.{i - 1}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.spill_path}.{i}")
+
+    def search(self, text, limit=1000, case_sensitive=False):
+        """
+        Find text in the whole retained history: rotated spill files, then memory.
+        Returns (line_number, line) pairs; line_number is None for lines that come
+        from an earlier session or an already-rotated part of this one.
+        """
+        needle = text if case_sensitive else text.lower()
+        results = []
+        with self._lock:
+            if self._spill:
+                self._spill.flush()
+            memory = list(self._lines)
+            first = self._first
+            files = self._spill_files()
+        current_count = self._count_lines(self.spill_path) if self.spill_path in files else 0
+        for path in files:
+            # only the current spill file lines up with this session's line numbers
+            base = first - current_count if path == self.spill_path else None
+            with open(path, encoding='utf-8', errors='replace') as f:
+                for i, line in enumerate(f):
+                    line = line.rstrip('\n')
+                    if needle in (line if case_sensitive else line.lower()):
+                        results.append((None if base is None else base + i, line))
+                        if len(results) >= limit:
+                            return results
+        for i, line in enumerate(memory):
+            if needle in (line if case_sensitive else line.lower()):
+                results.append((first + i, line))
+                if len(results) >= limit:
+                    break
+        return results
+
+    @staticmethod
+    def _count_lines(path):
+        with open(path, 'rb') as f:
+            return sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(1 << 16), b''))
+
+    def clear(self):
+        with self._lock:
+            self._lines.clear()
+            self._first = 0
+            if self._spill:
+                self._spill.close()
+                self._spill = None
+            for path in self._spill_files():
+                os.remove(path)
+
+    def close(self):
+        """Spill the lines still in memory too, so the next session can search all of them."""
+        with self._lock:
+            while self._lines:
+                self._write_spill(self._lines.popleft())
+                self._first += 1
+            if self._spill:
+                self._spill.close()
+                self._spill = None
+
+
+class VirtualLogView(ttk.Frame):
+    """
+    Read-only log pane that only ever holds the visible lines in its Text widget.
+
+    append() just stores the line in the buffer, so it is safe from worker threads;
+    the view re-renders at most every refresh_ms on the Tk thread. It follows the
+    tail until the user scrolls up, and resumes once scrolled back to the bottom.
+    """
+
+    def __init__(self, master, buffer, refresh_ms=100, **kwargs):
+        super().__init__(master, **kwargs)
+        self.buffer = buffer
+        self.refresh_ms = refresh_ms
+        self.top = 0
+        self.follow = True
+        self._dirty = True
+
+        self.text = tk.Text(self, wrap='none', state='disabled', height=1)
+        self._font = tkfont.Font(font=self.text.cget('font'))
+        self.vscroll = ttk.Scrollbar(self, orient='vertical', command=self._on_scroll)
+        self.hscroll = ttk.Scrollbar(self, orient='horizontal', command=self.text.xview)
+        self.text.configure(xscrollcommand=self.hscroll.set)
+        self.text.grid(row=0, column=0, sticky='nsew')
+        self.vscroll.grid(row=0, column=1, sticky='ns')
+        self.hscroll.grid(row=1, column=0, sticky='ew')
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+
+        self.text.bind('<Configure>', lambda _e: self._mark_dirty())
+        self.text.bind('<MouseWheel>', self._on_wheel)
+        self.text.bind('<Button-4>', lambda _e: self._scroll_lines(-3))
+        self.text.bind('<Button-5>', lambda _e: self._scroll_lines(3))
+        self.text.tag_configure('highlight', background='#fff3a0')
+        self._highlight = None
+        self.after(self.refresh_ms, self._tick)
+
+    def append(self, line):
+        self.buffer.append(line)
+        self._dirty = True
+
+    def clear(self):
+        self.buffer.clear()
+        self.top = 0
+        self.follow = True
+        self._mark_dirty()
+
+    def rows(self):
+        line_height = self._font.metrics('linespace') or 1
+        return max(self.text.winfo_height() // line_height, 1)
+
+    def jump_to(self, line_number):
+        """Scroll so line_number is visible and highlight it (if it is still in memory)."""
+        self.follow = False
+        self._highlight = line_number
+        self.top = max(line_number - self.rows() // 2, self.buffer.first_in_memory)
+        self._mark_dirty()
+
+    def _mark_dirty(self):
+        self._dirty = True
+
+    def refresh(self):
+        """Render now if anything changed; call from the Tk thread only."""
+        if self._dirty:
+            self._dirty = False
+            self._render()
+
+    def _tick(self):
+        self.refresh()
+        self.after(self.refresh_ms, self._tick)
+
+    def _max_top(self):
+        return max(len(self.buffer) - self.rows(), self.buffer.first_in_memory)
+
+    def _render(self):
+        rows = self.rows()
+        total = len(self.buffer)
+        first = self.buffer.first_in_memory
+        if self.follow:
+            self.top = self._max_top()
+        self.top = min(max(self.top, first), self._max_top())
+        lines = self.buffer.get_range(self.top, rows)
+
+        xview = self.text.xview()[0]
+        self.text.configure(state='normal')
+        self.text.delete('1.0', 'end')
+        self.text.insert('end', '\n'.join(lines))
+        if self._highlight is not None and self.top <= self._highlight < self.top + rows:
+            row = self._highlight - self.top + 1
+            self.text.tag_add('highlight', f"{row}.0", f"{row}.end")
+        self.text.configure(state='disabled')
+        self.text.xview_moveto(xview)
+
+        # the scrollbar only spans the lines still in memory; older ones are in the spill file
+        span = max(total - first, 1)
+        self.vscroll.set((self.top - first) / span, min((self.top - first + rows) / span, 1.0))
+
+    def _scroll_lines(self, delta):
+        self.top = min(max(self.top + delta, self.buffer.first_in_memory), self._max_top())
+        self.follow = self.top >= self._max_top()
+        self._mark_dirty()
+
+    def _on_wheel(self, event):
+        self._scroll_lines(-3 if event.delta > 0 else 3)
+
+    def _on_scroll(self, action, amount, unit=None):
+        if action == 'moveto':
+            first = self.buffer.first_in_memory
+            self.top = first + int(float(amount) * max(len(self.buffer) - first, 0))
+            self.top = min(max(self.top, first), self._max_top())
+            self.follow = self.top >= self._max_top()
+            self._mark_dirty()
+        elif action == 'scroll':
+            step = self.rows() if unit == 'pages' else 1
+            self._scroll_lines(int(amount) * step)
@@ -8,13 +8,24 @@ from tkinter import ttk
 from tkinter import simpledialog
 from tkinter.scrolledtext import ScrolledText
 from functools import partial
-from setup_project import scaffold_project
+from setup_project import scaffold_project, warm_up_project, ProjectExistsError
+from project_registry import ProjectRegistry
+from telemetry import track, load_records, summarize, find_regressions, is_regression, typical_duration
+from watch_build import WatchBuilder, pyinstaller_command
+from log_view import SpillingLogBuffer, VirtualLogView, LOG_DIR
+from progress import PipProgressParser, PyInstallerProgressParser, EtaEstimator, format_eta
+from fleet_upgrade import find_project_venvs, venvs_for_projects, upgrade_fleet, format_fleet_report
+from build_env import ensure_build_env, find_project_root
 import threading
+import time
 
 
 # Configuration file to store window size
 CONFIG_PATH = os.path.expanduser("~/.scaffolder_config.json")
 
+# Most projects the Projects tab lists at once; a hint under the list reports the rest
+PROJECT_LIST_LIMIT = 1000
+
 # Application metadata
 APP_TITLE = "Python Project Scaffolder"
 VERSION = "2.0"
@@ -31,24 +42,67 @@ Fields:
 - Destination Folder: The directory where your project folder will be created (defaults to current directory).
 - Framework: Choose between "tkinter", "pyqt5", or "pyqt6" for your GUI library.
 - License: Select the MIT license template or "None" to skip adding a license file.
+- Template Folder (optional): An existing skeleton project copied into the new project. Text files may use
+  {{project_name}}, {{description}}, {{author}} and {{gui_lib}} placeholders. venv/, .git/, build/ and dist/ are
+  skipped, plus anything listed in .scaffoldignore.
+- Hard-link template images and fonts: Instead of copying, links binary assets (images, fonts, sounds) from the
+  template folder, which is faster and saves disk space. Only use it if neither the template nor the new project
+  edits those files in place, since a linked file is shared by both.
 
 Options:
 - Initialize Git repository: Creates a new Git repo inside your project and makes an initial commit.
 - Include pytest tests: Sets up a basic tests/ folder with a placeholder test file.
 - Add GitHub Actions CI: Generates a simple GitHub Actions workflow to install dependencies and run pytest.
+- Cache pip in CI: Reuses downloaded packages between CI runs until requirements.txt changes.
+- Run CI tests in parallel: Installs pytest-xdist and spreads the tests over all CPUs of the CI runner. Off by
+  default; turn it on once the test suite is big enough to outweigh starting the workers.
+- CI Python versions: Comma-separated versions (e.g. 3.10, 3.11, 3.12) to test as a matrix; leave empty for one job.
 - Create docs folder: Adds a docs/ directory with an index.md stub for your project documentation.
 - Add pre-commit config: Creates a .pre-commit-config.yaml file configured to run Black formatting.
 - Add .editorconfig file: Provides an .editorconfig file to ensure consistent indentation and line endings.
 - Use src/ directory layout: Organizes your Python package under a src/ directory.
+- Responsive UI with worker threads: main.py gets a window with a progress bar and a sample long task that runs
+  on a worker pool (a queue polled with after() for tkinter, QThreadPool and signals for PyQt), plus workers.py.
+- Add asyncio integration: With the responsive UI, also runs an asyncio event loop in the background and adds a
+  sample async task.
+- Fast-start template (deferred imports): main.py imports the GUI toolkit inside main(). Heavy modules are bound
+  with lazy_import() and listed in DEFERRED_MODULES, so they only run once the first window is painted. With tests
+  enabled, tests/test_import_time.py fails when importing main.py exceeds the budget (IMPORT_BUDGET_MS).
+  Cannot be combined with the responsive UI, whose main.py imports the GUI toolkit up front.
+- Precompile and warm up imports: After scaffolding, byte-compiles the project and its venv on all CPUs and
+  test-imports main.py (without opening a window), logging the import time so the first launch is not slow.
+  Off by default, as it compiles all of the venv; the import test is skipped when the venv lacks the GUI toolkit.
 
 Buttons:
 - Start Scaffolding: Generates your project structure and files based on the above settings.
 - Update pip: Upgrades pip itself to the latest version and logs the updated version.
 - Update All Packages: Finds and upgrades any outdated packages, logging current vs. latest versions.
-- Package Executable: Bundles a selected script into a single executable using PyInstaller.
+- Fleet Upgrade: Upgrades packages in the venv/ folders of all registered projects (or of every project under a folder you pick), several at a time, then logs a combined report.
+- Package Executable: Bundles a selected script into a single executable using PyInstaller. The build runs in the
+  project's own build environment (build/buildenv): a venv made from the project's venv interpreter with
+  requirements.txt and PyInstaller installed. It is created on the first build and reused until requirements.txt
+  or the interpreter changes, so the bundle holds only the project's dependencies and builds skip pip.
+- Watch & Build: Asks once for the script, name and destination, then rebuilds the executable whenever a file in
+  the script's folder changes. Quick bursts of saves trigger one build, a newer change cancels a build in
+  progress, and build/ is kept between runs so rebuilds are incremental. Click again to stop watching.
 - Open in Editor: Launches VS Code or system file explorer in the project folder.
 - Open Terminal: Opens a system terminal in the scaffolded project folder.
-- Clear Log: Clears both Log and Terminal tabs.
+- Clear Log: Clears both Log and Terminal tabs, including their history on disk.
+- Search Logs: Finds text anywhere in the Log and Terminal history. The panes keep only the newest lines in memory;
+  older lines are saved to ~/.scaffolder_logs and are still searched. Double-click a result to jump to it.
+
+The progress bar under the buttons follows pip and PyInstaller as they run (collecting, downloading and installing
+for pip; Analysis, PYZ, PKG and EXE for PyInstaller) with an estimate of the time left. The Log tab only shows each
+phase as it starts; the full raw output is kept in the Terminal tab.
+
+Projects tab:
+- Lists every project you have scaffolded, most recently used first. Type in Search to filter by name or path.
+  The list holds the newest 1000 matches; the line under it tells you when there are more.
+- Select a project to make Open in Editor / Open Terminal act on it; double-click opens it in the editor.
+- Remove Selected forgets the selected entries; Prune Missing forgets projects whose folders were deleted.
+
+Help → Operation Stats shows how long each operation usually takes (median and slowest runs) and lists runs
+that were much slower than the history, e.g. after a PyInstaller upgrade or on a slow disk.
 
 Use File → New Project to clear all fields and start over at any time.
 '''
@@ -65,21 +119,36 @@ class ScaffoldApp(tk.Tk):
 
         # State variables
         self.last_path = None
+        self.watcher = None
+        # token of a watch that is still preparing its build environment (see _toggle_watch)
+        self.watch_pending = None
+        self._watch_lock = threading.Lock()
         self.project_name = tk.StringVar(value="MyApp")
         self.output_folder = tk.StringVar()
         self.gui_lib = tk.StringVar(value="PyQt6")
         self.license_type = tk.StringVar(value="MIT")
-        flags = ['git', 'tests', 'ci', 'docs', 'precommit', 'editor', 'src']
-        self.options = {flag: tk.BooleanVar(value=True) for flag in flags}
+        self.template_folder = tk.StringVar()
+        flags = ['git', 'tests', 'ci', 'docs', 'precommit', 'editor', 'src', 'ci_cache', 'ci_parallel', 'warmup', 'responsive', 'asyncio', 'fast_start', 'hardlink']
+        self.options = {flag: tk.BooleanVar() for flag in flags}
+        # comma-separated Python versions for the CI matrix; empty means a single '3.x' job
+        self.ci_python_versions = tk.StringVar(value="")
 
-        # make “Use src/ directory layout” default to OFF
-        self.options['src'].set(False)
+        self._reset_options()
+
+        # Registry of every scaffolded project; the app still works without it
+        try:
+            self.registry = ProjectRegistry()
+        except Exception:
+            self.registry = None
+        self.project_query = tk.StringVar()
 
         # Build interface
         self._create_menu()
         self._create_form()
         self._create_actions()
         self._create_notebook()
+        self._create_projects_tab()
+        self._restore_last_project()
 
     def _load_window_size(self):
         try:
@@ -100,6 +169,13 @@ class ScaffoldApp(tk.Tk):
 
     def _on_close(self):
         self._save_window_size()
+        with self._watch_lock:
+            self.watch_pending = None  # a watch still starting up will not start
+            watcher, self.watcher = self.watcher, None
+        if watcher:
+            watcher.stop()
+        for pane in (self.log_pane, self.term_pane):
+            pane.buffer.close()
         self.destroy()
 
     def _create_menu(self):
@@ -112,6 +188,7 @@ class ScaffoldApp(tk.Tk):
 
         help_menu = tk.Menu(menubar, tearoff=False)
         help_menu.add_command(label="Usage Guide", command=self._show_usage)
+        help_menu.add_command(label="Operation Stats", command=self._show_stats)
         help_menu.add_command(label="About", command=self._show_about)
         menubar.add_cascade(label="Help", menu=help_menu)
 
@@ -134,7 +211,7 @@ class ScaffoldApp(tk.Tk):
         ttk.Entry(ps_frame, textvariable=self.output_folder) \
             .grid(row=1, column=1, sticky='ew', pady=2)
         ttk.Button(ps_frame, text="Browse…",
-                   command=partial(self._browse_folder, self.output_folder)) \
+                   command=partial(self._browse_folder, self.output_folder, "Select Output Folder")) \
             .grid(row=1, column=2, padx=5, pady=2)
 
         # GUI framework
@@ -160,9 +237,18 @@ class ScaffoldApp(tk.Tk):
                        "None") \
             .grid(row=3, column=1, columnspan=2, sticky='ew', pady=2)
 
+        # Optional template project copied into the new project
+        ttk.Label(ps_frame, text="Template Folder:") \
+            .grid(row=4, column=0, sticky='w', pady=2)
+        ttk.Entry(ps_frame, textvariable=self.template_folder) \
+            .grid(row=4, column=1, sticky='ew', pady=2)
+        ttk.Button(ps_frame, text="Browse…",
+                   command=partial(self._browse_folder, self.template_folder, "Select Template Folder")) \
+            .grid(row=4, column=2, padx=5, pady=2)
+
         # ── BEGIN “Options for Beginners” ──
         opts_frame = ttk.LabelFrame(ps_frame, text="Options for Beginners")
-        opts_frame.grid(row=4, column=0, columnspan=3, sticky='ew', pady=(5, 10))
+        opts_frame.grid(row=5, column=0, columnspan=3, sticky='ew', pady=(5, 10))
 
         ttk.Checkbutton(opts_frame,
                         text="Initialize Git repository",
@@ -192,6 +278,38 @@ class ScaffoldApp(tk.Tk):
                         text="Use src/ directory layout",
                         variable=self.options['src']) \
             .grid(row=3, column=0, sticky='w')
+        ttk.Checkbutton(opts_frame,
+                        text="Cache pip in CI",
+                        variable=self.options['ci_cache']) \
+            .grid(row=3, column=1, sticky='w')
+        ttk.Checkbutton(opts_frame,
+                        text="Run CI tests in parallel",
+                        variable=self.options['ci_parallel']) \
+            .grid(row=4, column=0, sticky='w')
+        ttk.Checkbutton(opts_frame,
+                        text="Precompile and warm up imports",
+                        variable=self.options['warmup']) \
+            .grid(row=4, column=1, sticky='w')
+        ttk.Checkbutton(opts_frame,
+                        text="Responsive UI with worker threads",
+                        variable=self.options['responsive']) \
+            .grid(row=6, column=0, sticky='w')
+        ttk.Checkbutton(opts_frame,
+                        text="Add asyncio integration",
+                        variable=self.options['asyncio']) \
+            .grid(row=6, column=1, sticky='w')
+        ttk.Checkbutton(opts_frame,
+                        text="Fast-start template (deferred imports)",
+                        variable=self.options['fast_start']) \
+            .grid(row=7, column=0, sticky='w')
+        ttk.Checkbutton(opts_frame,
+                        text="Hard-link template images and fonts",
+                        variable=self.options['hardlink']) \
+            .grid(row=7, column=1, sticky='w')
+        ttk.Label(opts_frame, text="CI Python versions:") \
+            .grid(row=5, column=0, sticky='w')
+        ttk.Entry(opts_frame, textvariable=self.ci_python_versions) \
+            .grid(row=5, column=1, sticky='ew')
         # ── END “Options for Beginners” ──
 
     def _create_actions(self):
@@ -201,7 +319,9 @@ class ScaffoldApp(tk.Tk):
             ("Start Scaffolding", self._run_scaffold),
             ("Update pip", self._update_pip),
             ("Update All Packages", self._update_all),
+            ("Fleet Upgrade", self._fleet_upgrade),
             ("Package Executable", self._package_executable),
+            ("Watch & Build", self._toggle_watch),
             ("Open in Editor", self._open_in_editor),
             ("Open Terminal", self._open_terminal),
             ("Clear Log", self._clear_log)
@@ -209,60 +329,273 @@ class ScaffoldApp(tk.Tk):
         for text, cmd in buttons:
             ttk.Button(act_frame, text=text, command=cmd).pack(side='left', expand=True, fill='x', padx=3, pady=5)
 
+        # Progress of the running pip / PyInstaller step, parsed from its output
+        prog_frame = ttk.Frame(self)
+        prog_frame.pack(fill='x', padx=15)
+        self.progress_value = tk.DoubleVar(value=0.0)
+        self.progress_status = tk.StringVar(value="Idle")
+        ttk.Progressbar(prog_frame, variable=self.progress_value, maximum=100.0) \
+            .pack(side='left', fill='x', expand=True, padx=3)
+        ttk.Label(prog_frame, textvariable=self.progress_status, width=45) \
+            .pack(side='left', padx=3)
+        self.watch_status = tk.StringVar(value="")
+        ttk.Label(self, textvariable=self.watch_status, foreground='gray') \
+            .pack(fill='x', padx=18)
+
     def _create_notebook(self):
         self.notebook = ttk.Notebook(self)
         self.notebook.pack(fill='both', expand=True, padx=15, pady=5)
 
+        # Only the newest lines stay in memory; older ones spill to files in LOG_DIR
         log_frame = ttk.Frame(self.notebook)
-        self.log_pane = ScrolledText(log_frame, state='disabled', wrap='none')
+        self.log_pane = VirtualLogView(log_frame, SpillingLogBuffer(os.path.join(LOG_DIR, 'log.txt')))
         self.log_pane.pack(fill='both', expand=True)
         self.notebook.add(log_frame, text="Log")
 
         term_frame = ttk.Frame(self.notebook)
-        self.term_pane = ScrolledText(term_frame, state='disabled', wrap='none')
+        self.term_pane = VirtualLogView(term_frame, SpillingLogBuffer(os.path.join(LOG_DIR, 'terminal.txt')))
         self.term_pane.pack(fill='both', expand=True)
         self.notebook.add(term_frame, text="Terminal")
         self.notebook.add(term_frame, text="Terminal")
         self.notebook.add(term_frame, text="Console Output")
 
+        search_row = ttk.Frame(self)
+        search_row.pack(fill='x', padx=15)
+        self.log_query = tk.StringVar()
+        search_entry = ttk.Entry(search_row, textvariable=self.log_query)
+        search_entry.pack(side='left', fill='x', expand=True, padx=3)
+        search_entry.bind('<Return>', lambda _e: self._search_logs())
+        ttk.Button(search_row, text="Search Logs", command=self._search_logs).pack(side='left', padx=3)
+
         ttk.Label(self, text=f"© {AUTHOR}", font=(None, 8, 'italic'), foreground='gray').pack(side='bottom', pady=(0, 5))
 
-    def _browse_folder(self, var):
-        path = filedialog.askdirectory(title="Select Output Folder")
+    def _create_projects_tab(self):
+        proj_frame = ttk.Frame(self.notebook)
+        self.notebook.insert(0, proj_frame, text="Projects")
+
+        search_row = ttk.Frame(proj_frame)
+        search_row.pack(fill='x', pady=(5, 2))
+        ttk.Label(search_row, text="Search:").pack(side='left')
+        ttk.Entry(search_row, textvariable=self.project_query) \
+            .pack(side='left', fill='x', expand=True, padx=5)
+        ttk.Button(search_row, text="Remove Selected", command=self._remove_selected_projects) \
+            .pack(side='left', padx=3)
+        ttk.Button(search_row, text="Prune Missing", command=self._prune_missing_projects) \
+            .pack(side='left', padx=3)
+
+        self.project_tree = ttk.Treeview(proj_frame, columns=('name', 'path', 'created'),
+                                         show='headings', selectmode='extended')
+        for col, heading, width in (('name', "Name", 150), ('path', "Path", 400), ('created', "Created", 140)):
+            self.project_tree.heading(col, text=heading)
+            self.project_tree.column(col, width=width, anchor='w')
+        self.project_tree.pack(fill='both', expand=True)
+        self.projects_hint = tk.StringVar(value="")
+        ttk.Label(proj_frame, textvariable=self.projects_hint, foreground='gray') \
+            .pack(anchor='w', pady=(2, 0))
+        self.project_tree.bind('<<TreeviewSelect>>', self._on_project_selected)
+        self.project_tree.bind('<Double-1>', lambda _e: self._open_in_editor())
+
+        self.project_query.trace_add('write', lambda *_: self._refresh_projects())
+        self._refresh_projects()
+
+    def _refresh_projects(self):
+        self.project_tree.delete(*self.project_tree.get_children())
+        if not self.registry:
+            return
+        query = self.project_query.get()
+        entries = self.registry.search(query, limit=PROJECT_LIST_LIMIT)
+        for entry in entries:
+            created = time.strftime('%Y-%m-%d %H:%M', time.localtime(entry['created_at']))
+            self.project_tree.insert('', 'end', iid=entry['path'],
+                                     values=(entry['name'], entry['path'], created))
+        total = self.registry.count(query) if len(entries) == PROJECT_LIST_LIMIT else len(entries)
+        if total > len(entries):
+            self.projects_hint.set(f"Showing the {len(entries)} most recent of {total} projects; "
+                                   f"search to find older ones.")
+        else:
+            self.projects_hint.set(f"{total} project{'s' if total != 1 else ''}")
+
+    def _restore_last_project(self):
+        """Reopen the most recently used project so the editor/terminal buttons work after a restart."""
+        if not self.registry:
+            return
+        entry = self.registry.most_recent()
+        if entry and self.registry.is_alive(entry['path']):
+            self.last_path = entry['path']
+
+    def _record_project(self, path, name, options):
+        if not self.registry:
+            return
+        try:
+            self.registry.record(path, name, options)
+        except Exception as e:
+            self._log(f"Could not record project in registry: {e}")
+            return
+        self._refresh_projects()
+
+    def _on_project_selected(self, _event=None):
+        selection = self.project_tree.selection()
+        if len(selection) != 1:
+            return
+        path = selection[0]
+        # Liveness is only checked here, when the user actually picks a project
+        if not self.registry.is_alive(path):
+            self._log(f"Project folder no longer exists: {path}")
+            return
+        self.last_path = path
+        self.registry.touch(path)
+
+    def _remove_selected_projects(self):
+        selection = self.project_tree.selection()
+        if not selection or not self.registry:
+            return
+        for path in selection:
+            self.registry.remove(path)
+            if self.last_path == path:
+                self.last_path = None
+        self._log(f"Removed {len(selection)} project(s) from the registry.")
+        self._refresh_projects()
+
+    def _prune_missing_projects(self):
+        if not self.registry:
+            return
+        missing = [e['path'] for e in self.registry.search(limit=-1)
+                   if not self.registry.is_alive(e['path'])]
+        for path in missing:
+            self.registry.remove(path)
+        self._log(f"Pruned {len(missing)} missing project(s) from the registry.")
+        self._refresh_projects()
+
+    def _browse_folder(self, var, title):
+        path = filedialog.askdirectory(title=title)
         if path:
             var.set(path)
 
+    def _reset_options(self):
+        # everything defaults to ON except “Use src/ directory layout”, parallel CI tests
+        # (not worth the xdist start-up on a placeholder suite), the warm-up (it compiles
+        # all of site-packages), the responsive skeleton, asyncio, fast start and hard links
+        for flag, var in self.options.items():
+            var.set(flag not in ('src', 'ci_parallel', 'warmup', 'responsive', 'asyncio', 'fast_start',
+                                 'hardlink'))
+
     def _clear_form(self):
         self.project_name.set("MyApp")
         self.output_folder.set("")
+        self.template_folder.set("")
         self.gui_lib.set("tkinter")
         self.license_type.set("MIT")
-        for v in self.options.values():
-            v.set(True)
+        self._reset_options()
+        self.ci_python_versions.set("")
         self._clear_log()
 
     def _log(self, message):
-        self.log_pane.configure(state='normal')
-        self.log_pane.insert('end', message + '\n')
-        self.log_pane.see('end')
-        self.log_pane.configure(state='disabled')
+        self.log_pane.append(message)
 
     def _term_log(self, message):
-        self.term_pane.configure(state='normal')
-        self.term_pane.insert('end', message + '\n')
-        self.term_pane.see('end')
-        self.term_pane.configure(state='disabled')
+        self.term_pane.append(message)
+
+    def _search_logs(self):
+        """List matches from the whole Log/Terminal history, including lines spilled to disk."""
+        query = self.log_query.get()
+        if not query:
+            return
+        win = tk.Toplevel(self)
+        win.title(f"Search: {query}")
+        win.geometry("700x400")
+        results = tk.Listbox(win, font=('Courier', 9))
+        results.pack(fill='both', expand=True, padx=10, pady=10)
+        targets = []
+        for label, pane in (("Log", self.log_pane), ("Terminal", self.term_pane)):
+            for line_number, line in pane.buffer.search(query):
+                where = f"{line_number + 1:>7}" if line_number is not None else "  (old)"
+                results.insert('end', f"[{label}] {where}: {line}")
+                targets.append((pane, line_number))
+        if not targets:
+            results.insert('end', "No matches.")
+
+        def jump(_event=None):
+            selection = results.curselection()
+            if not selection or not targets:
+                return
+            pane, line_number = targets[selection[0]]
+            if line_number is None or line_number < pane.buffer.first_in_memory:
+                return  # only in the spill file; the match is shown in the list above
+            self.notebook.select(pane.master)
+            pane.jump_to(line_number)
+
+        results.bind('<Double-1>', jump)
+
+    def _set_progress(self, fraction, message, eta=None):
+        self.progress_value.set(fraction * 100)
+        remaining = f" — {format_eta(eta.eta(fraction))}" if eta else ""
+        self.progress_status.set(f"{message}{remaining}")
+        # operations on the GUI thread would otherwise only repaint once they finish
+        if threading.current_thread() is threading.main_thread():
+            self.log_pane.refresh()
+            self.term_pane.refresh()
+            self.update_idletasks()
+
+    def _stream_process(self, proc, parser, eta=None, offset=0.0, span=1.0):
+        """
+        Copy a subprocess's raw output to the Terminal tab while its parsed progress
+        drives the progress bar; only phase changes and errors reach the Log tab.
+        offset/span place this process within a larger operation (e.g. one of n packages).
+        """
+        last_phase = None
+        for line in proc.stdout:
+            line = line.rstrip()
+            self._term_log(line)
+            event = parser.feed(line)
+            if event is None:
+                continue
+            if event.phase != last_phase or event.phase == 'error':
+                self._log(f"  {event.message}")
+                last_phase = event.phase
+            if event.fraction is not None:
+                self._set_progress(offset + span * event.fraction, event.message, eta)
+        proc.wait()
+        return proc.returncode
 
     def _clear_log(self):
         for pane in (self.log_pane, self.term_pane):
-            pane.configure(state='normal')
-            pane.delete('1.0', 'end')
-            pane.configure(state='disabled')
+            pane.clear()
 
     def _show_about(self):
         messagebox.showinfo("About",
                             f"{APP_TITLE} v{VERSION}\nCreated by {AUTHOR}")
 
+    def _warn_slow(self, operation, duration):
+        self._log(f"Warning: '{operation}' took {duration:.1f}s, "
+                  f"much slower than usual (see Help → Operation Stats).")
+
+    def _report_regression(self, record):
+        if record.regression:
+            self._warn_slow(record.operation, record.duration)
+
+    def _show_stats(self):
+        records = load_records()
+        win = tk.Toplevel(self)
+        win.title("Operation Stats")
+        win.geometry("640x400")
+        txt = ScrolledText(win, wrap='none', font=('Courier', 9))
+        txt.pack(fill='both', expand=True, padx=10, pady=10)
+
+        def fmt(value):
+            return "-" if value is None else f"{value:.2f}s"
+
+        txt.insert('end', f"{'Operation':<16}{'Runs':>6}{'Failed':>8}{'p50':>10}{'p90':>10}{'p99':>10}{'Last':>10}\n")
+        for row in summarize(records):
+            txt.insert('end', f"{row['operation']:<16}{row['runs']:>6}{row['failures']:>8}"
+                              f"{fmt(row['p50']):>10}{fmt(row['p90']):>10}{fmt(row['p99']):>10}"
+                              f"{fmt(row['last']):>10}\n")
+        slow = find_regressions(records)
+        txt.insert('end', f"\nSlow runs ({len(slow)}):\n")
+        for r in slow[-50:]:
+            when = time.strftime('%Y-%m-%d %H:%M', time.localtime(r['started_at']))
+            txt.insert('end', f"  {when}  {r['operation']:<16}{fmt(r['duration'])}\n")
+        txt.configure(state='disabled')
+
     def _show_usage(self):
         win = tk.Toplevel(self)
         win.title("Usage Guide")
@@ -299,43 +632,91 @@ class ScaffoldApp(tk.Tk):
             return
 
         self._log("Checking for outdated packages…")
-        try:
-            # Get JSON list of outdated packages
-            data = subprocess.check_output(
-                [sys.executable, '-m', 'pip', 'list', '--outdated', '--format=json'],
-                text=True
-            )
-            pkgs = json.loads(data)
-            if not pkgs:
-                self._log("All packages are up-to-date.")
-                return
-
-            for pkg in pkgs:
-                name = pkg['name']
-                self._log(f"Upgrading {name}…")
-                proc = subprocess.Popen(
-                    [sys.executable, '-m', 'pip', 'install', '--upgrade', name],
-                    stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+        with track('update_all') as record:
+            try:
+                # Get JSON list of outdated packages
+                data = subprocess.check_output(
+                    [sys.executable, '-m', 'pip', 'list', '--outdated', '--format=json'],
+                    text=True
                 )
-                for line in proc.stdout:
-                    self._term_log(line.rstrip())
-                proc.wait()
-                self._log(f"{name} upgrade finished.")
-        except Exception as e:
-            self._log(f"Error updating packages: {e}")
-
-
-    def _package_executable(self):
-        """Bundle a selected Python script into an executable."""
-        # Don’t run from the frozen EXE itself
-        if getattr(sys, 'frozen', False):
-            messagebox.showwarning(
-                "Not Supported",
-                "You must run this script with Python to package an executable."
-                "Bundling from the standalone EXE is not supported."
+                record.subprocesses += 1
+                pkgs = json.loads(data)
+                record.options['packages'] = len(pkgs)
+                if not pkgs:
+                    self._log("All packages are up-to-date.")
+                    return
+
+                eta = EtaEstimator(typical_duration('update_all'))
+                for i, pkg in enumerate(pkgs):
+                    name = pkg['name']
+                    self._log(f"Upgrading {name}…")
+                    proc = subprocess.Popen(
+                        [sys.executable, '-m', 'pip', 'install', '--upgrade', name],
+                        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+                    )
+                    record.subprocesses += 1
+                    returncode = self._stream_process(proc, PipProgressParser(), eta,
+                                                      offset=i / len(pkgs), span=1 / len(pkgs))
+                    if returncode:
+                        record.exit_code = returncode
+                    self._log(f"{name} upgrade finished.")
+                self._set_progress(1.0, "All packages upgraded")
+            except Exception as e:
+                record.exit_code = 1
+                record.error = str(e)
+                self._log(f"Error updating packages: {e}")
+        self._report_regression(record)
+
+
+    def _fleet_upgrade(self):
+        """Upgrade packages in the venv/ of many scaffolded projects at once."""
+        use_registry = False
+        if self.registry:
+            use_registry = messagebox.askyesnocancel(
+                "Fleet Upgrade",
+                "Upgrade the venvs of all projects in the registry?\n"
+                "Choose No to pick a root folder to search instead."
             )
+            if use_registry is None:
+                return
+        if use_registry:
+            venvs = venvs_for_projects(e['path'] for e in self.registry.search(limit=-1))
+        else:
+            root = filedialog.askdirectory(title="Select folder containing your projects")
+            if not root:
+                return
+            venvs = find_project_venvs(root)
+        if not venvs:
+            self._log("Fleet upgrade: no project venvs found.")
             return
 
+        packages = simpledialog.askstring(
+            "Fleet Upgrade",
+            "Packages to upgrade (comma-separated), or leave empty for all outdated packages:"
+        )
+        if packages is None:
+            return
+        packages = [p.strip() for p in packages.split(',') if p.strip()] or None
+
+        self._log(f"Fleet upgrade of {len(venvs)} venv(s) started…")
+        threading.Thread(target=self._run_fleet_upgrade, args=(venvs, packages), daemon=True).start()
+
+    def _run_fleet_upgrade(self, venvs, packages):
+        def progress(report):
+            status = "failed" if report['error'] else f"{len(report['upgraded'])} upgraded"
+            self._term_log(f"{report['venv']}: {status} ({report['duration']:.1f}s)")
+
+        with track('fleet_upgrade', {'venvs': len(venvs), 'packages': packages}) as record:
+            reports = upgrade_fleet(venvs, packages=packages, on_result=progress)
+            # one pip list per venv, plus one pip install where something was upgraded
+            record.subprocesses = len(reports) + sum(1 for r in reports if r['upgraded'])
+            record.exit_code = 1 if any(r['error'] for r in reports) else 0
+        for line in format_fleet_report(reports).splitlines():
+            self._log(line)
+        self._report_regression(record)
+
+    def _ask_package_target(self):
+        """Ask for the script to bundle, the EXE name and the destination; None if cancelled."""
         # 1) Pick the script to bundle
         entry_script = filedialog.askopenfilename(
             title="Select Python script to bundle",
@@ -343,7 +724,7 @@ class ScaffoldApp(tk.Tk):
             filetypes=[("Python Files", "*.py")]
         )
         if not entry_script:
-            return
+            return None
 
         # 2) Ask for your EXE name (no extension)
         default_name = os.path.splitext(os.path.basename(entry_script))[0] or "app"
@@ -354,7 +735,7 @@ class ScaffoldApp(tk.Tk):
         )
         if not exe_name:
             self._log("Packaging cancelled (no name given).")
-            return
+            return None
 
         # 3) Ask where to save the EXE
         dest_folder = filedialog.askdirectory(
@@ -363,36 +744,130 @@ class ScaffoldApp(tk.Tk):
         )
         if not dest_folder:
             dest_folder = os.path.dirname(entry_script)
+        return entry_script, exe_name, dest_folder
+
+    def _toggle_watch(self):
+        """Start or stop rebuilding the executable whenever its sources change."""
+        with self._watch_lock:
+            watcher, self.watcher = self.watcher, None
+            cancelled = watcher is None and self.watch_pending is not None
+            self.watch_pending = None
+        if watcher:
+            watcher.stop()
+            self._log("Watch mode stopped.")
+            return
+        if cancelled:
+            # a second click while the build environment is still being prepared
+            self.watch_status.set("")
+            self._log("Watch mode cancelled before it started.")
+            return
+        if getattr(sys, 'frozen', False):
+            messagebox.showwarning(
+                "Not Supported",
+                "You must run this script with Python to package an executable."
+            )
+            return
+        target = self._ask_package_target()
+        if not target:
+            return
+        token = object()
+        with self._watch_lock:
+            self.watch_pending = token
+        self.watch_status.set("Watch: starting…")
+        threading.Thread(target=self._start_watch, args=(token,) + target, daemon=True).start()
+
+    def _start_watch(self, token, entry_script, exe_name, dest_folder):
+        # the build environment is checked once when watching starts, not on every rebuild
+        python = self._build_python(entry_script)
+        if not python:
+            with self._watch_lock:
+                if self.watch_pending is token:
+                    self.watch_pending = None
+            self.after(0, self.watch_status.set, "")
+            return
 
-        self._log(f"Packaging '{exe_name}.exe' from {entry_script} into {dest_folder}…")
-
-        # 4) Make sure PyInstaller is installed
+        watch_dir = os.path.dirname(os.path.abspath(entry_script))
+        # persistent work dir so PyInstaller can reuse its analysis between rebuilds
+        workpath = os.path.join(watch_dir, 'build', f"watch-{exe_name}")
+        exe_path = os.path.join(os.path.abspath(dest_folder), exe_name)
+        watcher = WatchBuilder(
+            pyinstaller_command(python, entry_script, exe_name, dest_folder, workpath),
+            watch_dir,
+            ignore_paths=[workpath, exe_path, exe_path + '.exe'],
+            on_status=lambda text: self.after(0, self.watch_status.set, f"Watch: {text}"),
+            on_output=self._term_log
+        )
+        with self._watch_lock:
+            if self.watch_pending is not token:
+                return  # cancelled (or the window closed) while the environment was prepared
+            self.watch_pending = None
+            self.watcher = watcher
+            watcher.start()
+        self._log(f"Watching {watch_dir}; '{exe_name}' is rebuilt on every change. Click Watch & Build again to stop.")
+
+    def _build_python(self, entry_script, record=None):
+        """Interpreter of the project's cached build environment (see build_env), or None on failure."""
+        project_dir = find_project_root(entry_script)
+        self._log(f"Checking build environment for {project_dir}…")
         try:
-            subprocess.run(
-                [sys.executable, '-m', 'pip', 'install', '--upgrade', 'pyinstaller'],
-                check=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+            python, rebuilt = ensure_build_env(project_dir, on_output=self._term_log)
+        except (OSError, subprocess.SubprocessError) as e:
+            if record:
+                record.exit_code = getattr(e, 'returncode', None) or 1
+            self._log(f"Error preparing the build environment: {e}")
+            return None
+        if record and rebuilt:
+            record.subprocesses += 2
+        self._log("Build environment created." if rebuilt else "Reusing cached build environment.")
+        return python
+
+    def _package_executable(self):
+        """Bundle a selected Python script into an executable."""
+        # Don’t run from the frozen EXE itself
+        if getattr(sys, 'frozen', False):
+            messagebox.showwarning(
+                "Not Supported",
+                "You must run this script with Python to package an executable."
+                "Bundling from the standalone EXE is not supported."
             )
-        except subprocess.CalledProcessError as e:
-            self._log(f"Error installing PyInstaller: {e}")
             return
 
-        # 5) Run PyInstaller
-        cmd = [
-            sys.executable, '-m', 'PyInstaller',
-            '--onefile', '--windowed',
-            '--name', exe_name,
-            '--distpath', dest_folder,
-            entry_script
-        ]
-        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-        for line in proc.stdout:
-            self._term_log(line.rstrip())
-        proc.wait()
+        # 1-3) Pick the script, the EXE name and the destination
+        target = self._ask_package_target()
+        if not target:
+            return
+        # creating the build environment can take minutes, so build off the GUI thread
+        threading.Thread(target=self._run_package, args=target, daemon=True).start()
 
-        if proc.returncode == 0:
-            self._log("Packaging succeeded.")
-        else:
-            self._log(f"Packaging failed (exit code {proc.returncode}).")
+    def _run_package(self, entry_script, exe_name, dest_folder):
+        self._log(f"Packaging '{exe_name}.exe' from {entry_script} into {dest_folder}…")
+
+        with track('package', {'entry_script': entry_script, 'exe_name': exe_name}) as record:
+            # 4) Get the project's build environment (PyInstaller plus the project's requirements)
+            python = self._build_python(entry_script, record)
+            if not python:
+                return
+
+            # 5) Run PyInstaller inside it
+            cmd = pyinstaller_command(python, entry_script, exe_name, dest_folder)
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+            record.subprocesses += 1
+            self._set_progress(0.0, "Starting PyInstaller")
+            record.exit_code = self._stream_process(proc, PyInstallerProgressParser(),
+                                                    EtaEstimator(typical_duration('package')))
+            self._set_progress(1.0 if proc.returncode == 0 else 0.0,
+                               "Build complete" if proc.returncode == 0 else "Build failed")
+
+            if proc.returncode == 0:
+                for ext in ('.exe', ''):
+                    exe_path = os.path.join(dest_folder, exe_name + ext)
+                    if os.path.isfile(exe_path):
+                        record.bytes_written = os.path.getsize(exe_path)
+                        break
+                self._log("Packaging succeeded.")
+            else:
+                self._log(f"Packaging failed (exit code {proc.returncode}).")
+        self._report_regression(record)
 
 
     
@@ -400,6 +875,11 @@ class ScaffoldApp(tk.Tk):
         if not self.last_path:
             messagebox.showwarning("No Project", "Please scaffold a project first.")
             return
+        if not os.path.isdir(self.last_path):
+            messagebox.showwarning("Project Missing", f"{self.last_path} no longer exists.")
+            return
+        if self.registry:
+            self.registry.touch(self.last_path)
         self._log(f"Opening editor at {self.last_path}")
         try:
             subprocess.Popen(["code", self.last_path])
@@ -415,6 +895,11 @@ class ScaffoldApp(tk.Tk):
         if not self.last_path:
             messagebox.showwarning("No Project", "Please scaffold a project first.")
             return
+        if not os.path.isdir(self.last_path):
+            messagebox.showwarning("Project Missing", f"{self.last_path} no longer exists.")
+            return
+        if self.registry:
+            self.registry.touch(self.last_path)
         if sys.platform.startswith("win"):
             subprocess.Popen(["cmd.exe", "/K", f"cd /d {self.last_path}"])
         elif sys.platform.startswith("darwin"):
@@ -427,9 +912,13 @@ class ScaffoldApp(tk.Tk):
         if not name:
             messagebox.showwarning("Input Required", "Please enter a project name.")
             return
+        if self.options['fast_start'].get() and self.options['responsive'].get():
+            messagebox.showwarning("Incompatible Options",
+                                   "Choose either the responsive UI or the fast-start template, not both.")
+            return
         self._log(f"Scaffolding '{name}'...")
         try:
-            path = scaffold_project(
+            settings = dict(
                 project_name=name,
                 description=f"A Python desktop app named {name}",
                 author=AUTHOR,
@@ -442,27 +931,76 @@ class ScaffoldApp(tk.Tk):
                 include_precommit=self.options['precommit'].get(),
                 include_editorconfig=self.options['editor'].get(),
                 use_src=self.options['src'].get(),
-                output_dir=self.output_folder.get() or None
+                output_dir=self.output_folder.get() or None,
+                ci_python_versions=[v for v in self.ci_python_versions.get().split(',') if v.strip()],
+                ci_cache_pip=self.options['ci_cache'].get(),
+                ci_parallel_tests=self.options['ci_parallel'].get(),
+                template_dir=self.template_folder.get() or None,
+                hardlink_assets=self.options['hardlink'].get(),
+                responsive_ui=self.options['responsive'].get(),
+                use_asyncio=self.options['asyncio'].get(),
+                fast_start=self.options['fast_start'].get()
             )
+            try:
+                path = scaffold_project(**settings)
+            except ProjectExistsError as e:
+                if not messagebox.askyesno("Project Exists", f"{e}.\n\nOverwrite its files?"):
+                    self._log("Scaffolding cancelled; the existing project was left untouched.")
+                    return
+                path = scaffold_project(overwrite=True, **settings)
             self.last_path = path
             self._log(f"Project created at {path}")
+            # scaffold_project records itself; its entry is the latest one in the history
+            history = load_records('scaffold', recent=True)
+            if history and history[-1].get('exit_code') == 0 \
+                    and is_regression(history[-1]['duration'], history[:-1]):
+                self._warn_slow('scaffold', history[-1]['duration'])
+            self._record_project(path, name, {
+                'gui_lib': self.gui_lib.get(),
+                'license': self.license_type.get(),
+                **{flag: var.get() for flag, var in self.options.items()},
+                'ci_python_versions': self.ci_python_versions.get(),
+                'template_dir': self.template_folder.get(),
+            })
+            if self.options['warmup'].get() and not getattr(sys, 'frozen', False):
+                threading.Thread(target=self._run_warm_up, args=(path, self.gui_lib.get()), daemon=True).start()
         except Exception as e:
             self._log(f"Error during scaffolding: {e}")
             messagebox.showerror("Scaffolding Error", str(e))
 
+    def _run_warm_up(self, path, gui_lib):
+        # byte-compiling site-packages takes a few seconds, so keep it off the GUI thread
+        self._log("Precompiling project and venv, then test-importing main.py…")
+        report = warm_up_project(path, gui_lib)
+        if report['compiled']:
+            self._log("Bytecode precompiled.")
+        if report['import_time'] is not None:
+            self._log(f"main.py imports in {report['import_time'] * 1000:.0f} ms.")
+        if report['skipped']:
+            self._log(report['skipped'] + ".")
+        if report['error']:
+            self._log(f"Warm-up problem: {report['error']}")
+
     def _run_update_pip(self):
         # runs pip update in a separate thread so the GUI stays responsive
         self._log("Updating pip...")
-        proc = subprocess.Popen(
-            [sys.executable, '-m', 'pip', 'install', '--upgrade', 'pip'],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True
-        )
-        for line in proc.stdout:
-            self._log(line.strip())
-        proc.wait()
-        self._log("Pip update complete.")
+        with track('update_pip') as record:
+            proc = subprocess.Popen(
+                [sys.executable, '-m', 'pip', 'install', '--upgrade', 'pip'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True
+            )
+            record.subprocesses += 1
+            record.exit_code = self._stream_process(proc, PipProgressParser(),
+                                                    EtaEstimator(typical_duration('update_pip')))
+        if record.exit_code == 0:
+            self._set_progress(1.0, "Pip update complete")
+            self._log("Pip update complete.")
+        else:
+            self._set_progress(0.0, "Pip update failed")
+            self._log(f"Pip update failed (exit code {record.exit_code}).")
+        self._report_regression(record)
 
 
 
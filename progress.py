@@ -0,0 +1,156 @@
+import re
+import time
+from collections import namedtuple
+
+
+# phase: short machine name, fraction: 0.0–1.0 overall, message: one line for the Log pane
+ProgressEvent = namedtuple('ProgressEvent', ['phase', 'fraction', 'message', 'bytes_done'])
+
+_SIZE_UNITS = {'b': 1, 'kb': 10 ** 3, 'mb': 10 ** 6, 'gb': 10 ** 9,
+               'kib': 2 ** 10, 'mib': 2 ** 20, 'gib': 2 ** 30}
+
+
+def parse_size(text):
+    """Turn pip's '(1.2 MB)' style sizes into bytes; returns 0 when unrecognised."""
+    m = re.match(r'\s*([\d.]+)\s*([kmg]?i?b)\s*$', text, re.IGNORECASE)
+    if not m:
+        return 0
+    return int(float(m.group(1)) * _SIZE_UNITS[m.group(2).lower()])
+
+
+class PipProgressParser:
+    """
+    Streaming parser for `pip install` output.
+
+    pip prints no progress bars when its output is piped, so progress is derived
+    from the phases it walks through: collecting/downloading each requirement,
+    then installing, then the final summary. The resolve phase has no known end,
+    so its fraction approaches (but never reaches) the installing phase.
+    """
+
+    _collect = re.compile(r'^\s*Collecting (\S+)')
+    _download = re.compile(r'^\s*Downloading (\S+)(?:\s+\(([^)]+)\))?')
+    _cached = re.compile(r'^\s*Using cached (\S+)')
+    _satisfied = re.compile(r'^\s*Requirement already satisfied: (\S+)')
+    _installing = re.compile(r'^\s*Installing collected packages: (.+)')
+    _success = re.compile(r'^\s*Successfully installed (.+)')
+    _error = re.compile(r'^\s*ERROR: (.+)')
+
+    RESOLVE_END = 0.7
+    INSTALL_START = 0.75
+
+    def __init__(self):
+        self.requirements = 0
+        self.bytes_done = 0
+
+    def _resolve_fraction(self):
+        # 1 requirement -> 0.35, 3 -> 0.525, ... creeping towards RESOLVE_END
+        return self.RESOLVE_END * (1 - 0.5 ** self.requirements)
+
+    def feed(self, line):
+        """Return a ProgressEvent for lines that move progress on, otherwise None."""
+        m = self._collect.match(line)
+        if m:
+            self.requirements += 1
+            return ProgressEvent('collecting', self._resolve_fraction(),
+                                 f"Collecting {m.group(1)}", self.bytes_done)
+        m = self._download.match(line)
+        if m:
+            self.bytes_done += parse_size(m.group(2) or '')
+            return ProgressEvent('downloading', self._resolve_fraction(),
+                                 f"Downloading {m.group(1)}", self.bytes_done)
+        m = self._cached.match(line)
+        if m:
+            return ProgressEvent('downloading', self._resolve_fraction(),
+                                 f"Using cached {m.group(1)}", self.bytes_done)
+        m = self._satisfied.match(line)
+        if m:
+            return ProgressEvent('collecting', self._resolve_fraction(),
+                                 f"Already satisfied: {m.group(1)}", self.bytes_done)
+        m = self._installing.match(line)
+        if m:
+            return ProgressEvent('installing', self.INSTALL_START,
+                                 f"Installing {m.group(1).strip()}", self.bytes_done)
+        m = self._success.match(line)
+        if m:
+            return ProgressEvent('done', 1.0, f"Installed {m.group(1).strip()}", self.bytes_done)
+        m = self._error.match(line)
+        if m:
+            return ProgressEvent('error', None, m.group(1).strip(), self.bytes_done)
+        return None
+
+
+class PyInstallerProgressParser:
+    """
+    Streaming parser for PyInstaller build logs.
+
+    PyInstaller always walks Analysis -> PYZ -> PKG -> EXE, and Analysis is by far
+    the longest step, so each phase start maps to a fixed point on the bar. Within
+    Analysis the hook/module lines nudge the bar forward so it does not look stuck.
+    """
+
+    # (pattern, phase, fraction at phase start, message)
+    _phases = [
+        (re.compile(r'INFO: PyInstaller: '), 'starting', 0.02, "Starting PyInstaller"),
+        (re.compile(r'INFO: (?:Running Analysis|Initializing module dependency graph)'),
+         'analysis', 0.05, "Analysing imports"),
+        (re.compile(r'INFO: Building PYZ'), 'pyz', 0.70, "Building PYZ archive"),
+        (re.compile(r'INFO: Building PKG'), 'pkg', 0.78, "Building PKG archive"),
+        (re.compile(r'INFO: Building EXE'), 'exe', 0.90, "Building executable"),
+        (re.compile(r'INFO: Build complete!'), 'done', 1.0, "Build complete"),
+    ]
+    _analysis_step = re.compile(r'INFO: (?:Processing|Loading module hook|Looking for|Analyzing|Caching)')
+    _error = re.compile(r'(?:ERROR|CRITICAL): (.+)')
+    ANALYSIS_END = 0.68
+
+    def __init__(self):
+        self.phase = None
+        self.fraction = 0.0
+
+    def feed(self, line):
+        for pattern, phase, fraction, message in self._phases:
+            if pattern.search(line):
+                self.phase = phase
+                self.fraction = max(self.fraction, fraction)
+                return ProgressEvent(phase, self.fraction, message, 0)
+        if self.phase == 'analysis' and self._analysis_step.search(line):
+            # close 2% of the remaining gap per step: always moving, never past Analysis
+            self.fraction += (self.ANALYSIS_END - self.fraction) * 0.02
+            return ProgressEvent('analysis', self.fraction, "Analysing imports", 0)
+        m = self._error.search(line)
+        if m:
+            return ProgressEvent('error', None, m.group(1).strip(), 0)
+        return None
+
+
+class EtaEstimator:
+    """
+    Estimate remaining seconds from the fraction done and the elapsed time.
+
+    expected: typical total duration (e.g. the median from the telemetry history),
+    used while too little progress has been made to extrapolate from.
+    """
+
+    def __init__(self, expected=None, clock=time.monotonic):
+        self.expected = expected
+        self.clock = clock
+        self.started = clock()
+
+    def eta(self, fraction):
+        elapsed = self.clock() - self.started
+        if fraction is None:
+            return None
+        if fraction >= 1.0:
+            return 0.0
+        if fraction < 0.05:
+            return max(self.expected - elapsed, 0.0) if self.expected else None
+        return elapsed * (1.0 - fraction) / fraction
+
+
+def format_eta(seconds):
+    if seconds is None:
+        return "estimating…"
+    seconds = int(round(seconds))
+    if seconds >= 60:
+        return f"{seconds // 60}m {seconds % 60:02d}s left"
+    return f"{seconds}s left"
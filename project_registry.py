@@ -0,0 +1,123 @@
+import os
+import json
+import time
+import sqlite3
+from contextlib import contextmanager
+
+
+# Registry database lives next to the window-size config in the user's home folder
+REGISTRY_PATH = os.path.expanduser("~/.scaffolder_projects.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    path TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    options TEXT NOT NULL DEFAULT '{}',
+    created_at REAL NOT NULL,
+    last_opened_at REAL NOT NULL
+);
+-- substring search (LIKE '%q%') cannot use an index on name, so none is kept
+DROP INDEX IF EXISTS idx_projects_name;
+CREATE INDEX IF NOT EXISTS idx_projects_last_opened ON projects (last_opened_at);
+"""
+
+
+class ProjectRegistry:
+    """
+    Persistent index of every project the scaffolder has created.
+
+    Each call opens its own short-lived connection so the registry can be used
+    from the GUI thread and from worker threads alike. Paths are stored as given
+    and only checked for existence when a caller asks (see is_alive), so a
+    registry with hundreds of entries costs nothing at startup.
+    """
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or REGISTRY_PATH
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """A connection that commits (or rolls back) and is closed when the block exits."""
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _to_dict(row):
+        entry = dict(row)
+        entry['options'] = json.loads(entry['options'] or '{}')
+        return entry
+
+    def record(self, path, name, options=None):
+        """Add a freshly scaffolded project, or refresh it if the path is already known."""
+        path = os.path.abspath(path)
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO projects (path, name, options, created_at, last_opened_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(path) DO UPDATE SET name = excluded.name, "
+                "options = excluded.options, last_opened_at = excluded.last_opened_at",
+                (path, name, json.dumps(options or {}, sort_keys=True), now, now)
+            )
+        return path
+
+    def touch(self, path):
+        """Mark a project as just opened so it sorts to the top of the list."""
+        with self._connect() as conn:
+            conn.execute("UPDATE projects SET last_opened_at = ? WHERE path = ?",
+                         (time.time(), os.path.abspath(path)))
+
+    def remove(self, path):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM projects WHERE path = ?", (os.path.abspath(path),))
+
+    def get(self, path):
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM projects WHERE path = ?",
+                               (os.path.abspath(path),)).fetchone()
+        return self._to_dict(row) if row else None
+
+    @staticmethod
+    def _pattern(query):
+        # % and _ in the query are matched literally
+        escaped = query.strip().replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        return f"%{escaped}%"
+
+    def search(self, query="", limit=1000):
+        """
+        Return projects whose name or path contains query (case-insensitive),
+        most recently opened first. limit=-1 returns them all; see count().
+        """
+        pattern = self._pattern(query)
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM projects WHERE name LIKE ? ESCAPE '\\' OR path LIKE ? ESCAPE '\\' "
+                "ORDER BY last_opened_at DESC LIMIT ?",
+                (pattern, pattern, limit)
+            ).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def count(self, query=""):
+        """Number of projects search(query) would return without a limit."""
+        pattern = self._pattern(query)
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM projects WHERE name LIKE ? ESCAPE '\\' OR path LIKE ? ESCAPE '\\'",
+                (pattern, pattern)
+            ).fetchone()[0]
+
+    def most_recent(self):
+        results = self.search(limit=1)
+        return results[0] if results else None
+
+    @staticmethod
+    def is_alive(path):
+        """Check lazily whether a registered project folder still exists."""
+        return os.path.isdir(path)
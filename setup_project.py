@@ -2,6 +2,156 @@ import os
 import subprocess
 import textwrap
 import sys
+from contextlib import contextmanager
+from telemetry import track, directory_size
+from fleet_upgrade import venv_python
+from template_copy import copy_template
+from gui_templates import (
+    render_responsive_main, WORKERS_MODULE, WORKERS_TEST,
+    render_fast_start_main, render_import_budget_test, LAZY_IMPORT_MODULE,
+)
+
+# Python version used by the generated CI workflow when no matrix is requested
+DEFAULT_CI_PYTHON = '3.x'
+
+# Startup budget written into the fast-start template's import-time test
+DEFAULT_IMPORT_BUDGET_MS = 300
+
+
+class ProjectLockedError(FileExistsError):
+    """Another scaffold is currently writing the same project folder."""
+
+
+class ProjectExistsError(FileExistsError):
+    """The project folder already has files in it and overwrite was not requested."""
+
+
+def lock_path(project_dir):
+    """
+    The lock file project_lock() uses for project_dir: `.<name>.scaffold.lock` next to
+    the folder rather than inside it, so `git add .` never picks it up. When the output
+    folder is itself named after the project, scaffold_project() writes straight into
+    it, so the lock lands in the output folder's parent.
+    """
+    project_dir = os.path.abspath(project_dir)
+    return os.path.join(os.path.dirname(project_dir), f".{os.path.basename(project_dir)}.scaffold.lock")
+
+
+def _try_lock(fd):
+    """Take a non-blocking exclusive OS lock on fd; False if someone else holds it."""
+    try:
+        if os.name == 'nt':
+            import msvcrt
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+@contextmanager
+def project_lock(project_dir):
+    """
+    Hold an exclusive lock on project_dir for the duration of the block.
+
+    The lock is an OS file lock (flock, or msvcrt.locking on Windows) on a file next
+    to the folder (see lock_path), so it works across threads and processes and is released by the
+    OS if the holder dies; there is no stale-lock detection to race on. Raises
+    ProjectLockedError straight away if the folder is locked.
+    """
+    path = lock_path(project_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    while True:
+        fd = os.open(path, os.O_CREAT | os.O_RDWR, 0o644)
+        if not _try_lock(fd):
+            os.close(fd)
+            raise ProjectLockedError(
+                f"{project_dir} is being scaffolded by another process (lock file: {path})"
+            )
+        # the previous holder removes the file on release; if we locked a file that was
+        # removed after we opened it, the lock means nothing, so try the current one
+        try:
+            if os.path.samestat(os.fstat(fd), os.stat(path)):
+                break
+        except FileNotFoundError:
+            pass
+        os.close(fd)
+    try:
+        yield path
+    finally:
+        # remove while still holding the lock; Windows cannot delete an open file, so it stays
+        if os.name != 'nt':
+            os.remove(path)
+        os.close(fd)
+
+
+def _check_empty(project_dir):
+    if os.path.isdir(project_dir) and os.listdir(project_dir):
+        raise ProjectExistsError(f"{project_dir} already exists and is not empty")
+
+
+def render_ci_workflow(python_versions=None, cache_pip=False, parallel_tests=False):
+    """
+    Return the text of a GitHub Actions workflow that installs requirements and runs pytest.
+
+    python_versions: list of versions to run as a matrix (one job per version).
+    cache_pip: cache pip downloads keyed on requirements.txt via actions/setup-python.
+    parallel_tests: install pytest-xdist and spread the tests over all runner CPUs.
+    """
+    versions = [str(v).strip() for v in (python_versions or []) if str(v).strip()]
+    lines = [
+        "name: CI",
+        "",
+        "on:",
+        "  push:",
+        "    branches: [ main ]",
+        "  pull_request:",
+        "    branches: [ main ]",
+        "",
+        "jobs:",
+        "  test:",
+        "    runs-on: ubuntu-latest",
+    ]
+    if versions:
+        lines += [
+            "    strategy:",
+            "      fail-fast: false",
+            "      matrix:",
+            "        python-version: [" + ", ".join(f"'{v}'" for v in versions) + "]",
+        ]
+        python_version = "${{ matrix.python-version }}"
+    else:
+        python_version = DEFAULT_CI_PYTHON
+    lines += [
+        "    steps:",
+        "      - uses: actions/checkout@v3",
+        "      - name: Set up Python",
+        "        uses: actions/setup-python@v4",
+        "        with:",
+        f"          python-version: '{python_version}'",
+    ]
+    if cache_pip:
+        lines += [
+            "          cache: 'pip'",
+            "          cache-dependency-path: requirements.txt",
+        ]
+    test_deps = "pytest pytest-xdist" if parallel_tests else "pytest"
+    pytest_cmd = "pytest --maxfail=1 --disable-warnings -q"
+    if parallel_tests:
+        pytest_cmd += " -n auto"
+    lines += [
+        "      - name: Install dependencies",
+        "        run: |",
+        "          python -m pip install --upgrade pip",
+        "          pip install -r requirements.txt",
+        f"          pip install {test_deps}",
+        "      - name: Run tests",
+        f"        run: {pytest_cmd}",
+    ]
+    return "\n".join(lines) + "\n"
+
 
 def scaffold_project(
     project_name,
@@ -16,12 +166,53 @@ def scaffold_project(
     include_precommit,
     include_editorconfig,
     use_src,
-    output_dir=None
+    output_dir=None,
+    ci_python_versions=None,
+    ci_cache_pip=False,
+    ci_parallel_tests=False,
+    template_dir=None,
+    hardlink_assets=False,
+    responsive_ui=False,
+    use_asyncio=False,
+    fast_start=False,
+    import_budget_ms=DEFAULT_IMPORT_BUDGET_MS,
+    create_venv=True,
+    overwrite=False
 ):
     """
     Create a new Python project scaffold.
     Returns the path to the created project.
+
+    The ci_* options only apply when include_ci is set; see render_ci_workflow.
+    template_dir: reference project tree copied over the generated files, with
+    {{project_name}}, {{description}}, {{author}} and {{gui_lib}} substituted in text
+    files; hardlink_assets links images/fonts instead of copying (see copy_template).
+    responsive_ui: generate a main.py that runs work off the GUI thread via workers.py
+    (use_asyncio adds an asyncio loop and a sample coroutine task).
+    fast_start: keep `import main` cheap (GUI imports inside main(), heavy modules
+    loaded after the first paint via lazy_import.py) and, with include_tests, add a
+    test that fails when importing main takes longer than import_budget_ms.
+    fast_start cannot be combined with responsive_ui, whose main.py imports the GUI
+    toolkit at module level (ValueError).
+    create_venv=False skips the venv/ folder (it is always skipped in a frozen build).
+    The project folder is locked while it is written, so a concurrent scaffold of the
+    same folder raises ProjectLockedError instead of interleaving files (see project_lock).
+    A folder that already has files in it raises ProjectExistsError unless overwrite is set.
+    Every call is recorded in the operation history (see telemetry.track).
     """
+    if fast_start and responsive_ui:
+        raise ValueError("The fast-start template cannot be combined with the responsive UI skeleton")
+    options = {
+        'project_name': project_name, 'license_type': license_type, 'gui_lib': gui_lib,
+        'use_git': use_git, 'include_tests': include_tests, 'include_ci': include_ci,
+        'include_docs': include_docs, 'include_precommit': include_precommit,
+        'include_editorconfig': include_editorconfig, 'use_src': use_src,
+        'ci_python_versions': ci_python_versions, 'ci_cache_pip': ci_cache_pip,
+        'ci_parallel_tests': ci_parallel_tests, 'template_dir': template_dir,
+        'hardlink_assets': hardlink_assets, 'responsive_ui': responsive_ui, 'use_asyncio': use_asyncio,
+        'fast_start': fast_start, 'import_budget_ms': import_budget_ms, 'create_venv': create_venv,
+        'overwrite': overwrite,
+    }
     base_dir = output_dir or os.getcwd()
     # Determine project directory, avoiding an extra nested folder when base_dir matches project_name
     abs_base_dir = os.path.abspath(base_dir)
@@ -29,12 +220,40 @@ def scaffold_project(
         project_dir = base_dir
     else:
         project_dir = os.path.join(base_dir, project_name)
+    with track('scaffold', options) as record, project_lock(project_dir):
+        if not overwrite:
+            _check_empty(project_dir)
+        _write_project(
+            record, base_dir, project_dir,
+            project_name=project_name, description=description, author=author, license_type=license_type,
+            gui_lib=gui_lib, use_git=use_git, include_tests=include_tests, include_ci=include_ci,
+            include_docs=include_docs, include_precommit=include_precommit,
+            include_editorconfig=include_editorconfig, use_src=use_src, ci_python_versions=ci_python_versions,
+            ci_cache_pip=ci_cache_pip, ci_parallel_tests=ci_parallel_tests, template_dir=template_dir,
+            hardlink_assets=hardlink_assets, responsive_ui=responsive_ui, use_asyncio=use_asyncio,
+            fast_start=fast_start, import_budget_ms=import_budget_ms, create_venv=create_venv
+        )
+        record.bytes_written = directory_size(project_dir)
+    return project_dir
+
+
+def _write_project(
+    record, base_dir, project_dir, *, project_name, description, author, license_type, gui_lib,
+    use_git, include_tests, include_ci, include_docs, include_precommit, include_editorconfig,
+    use_src, ci_python_versions, ci_cache_pip, ci_parallel_tests, template_dir, hardlink_assets,
+    responsive_ui, use_asyncio, fast_start, import_budget_ms, create_venv
+):
+    """
+    The body of scaffold_project; counts the subprocesses it runs on the telemetry record.
+    Options are keyword-only so a new or reordered option cannot shift the others.
+    """
     os.makedirs(project_dir, exist_ok=True)
     # create a virtual environment automatically
     # only create a virtual environment when not running as a bundled executable
-    if not getattr(sys, 'frozen', False):
+    if create_venv and not getattr(sys, 'frozen', False):
         venv_dir = os.path.join(project_dir, 'venv')
         subprocess.check_call([sys.executable, '-m', 'venv', venv_dir])
+        record.subprocesses += 1
     # 1. Create src/ layout or root package
     if use_src:
         pkg_dir = os.path.join(project_dir, 'src', project_name)
@@ -52,7 +271,11 @@ def scaffold_project(
     # 2. Generate main.py stub
     main_path = os.path.join(project_dir, 'main.py')
     with open(main_path, 'w') as f:
-        if gui_lib == 'tkinter':
+        if responsive_ui:
+            f.write(render_responsive_main(gui_lib, project_name, use_asyncio))
+        elif fast_start:
+            f.write(render_fast_start_main(gui_lib, project_name))
+        elif gui_lib == 'tkinter':
             f.write(textwrap.dedent(f"""
                 import tkinter as tk
 
@@ -105,6 +328,13 @@ def scaffold_project(
                     main()
             """))
 
+    if responsive_ui:
+        with open(os.path.join(project_dir, 'workers.py'), 'w') as f:
+            f.write(WORKERS_MODULE)
+    if fast_start:
+        with open(os.path.join(project_dir, 'lazy_import.py'), 'w') as f:
+            f.write(LAZY_IMPORT_MODULE)
+
     # 3. Generate README.md
     readme_path = os.path.join(project_dir, 'README.md')
     with open(readme_path, 'w') as f:
@@ -165,6 +395,20 @@ def scaffold_project(
                 def test_placeholder():
                     assert True  # Replace with real tests
             """))
+        if responsive_ui:
+            with open(os.path.join(tests_dir, 'conftest.py'), 'w') as f:
+                f.write(textwrap.dedent("""
+                    import os
+                    import sys
+
+                    # Make main.py and workers.py at the project root importable
+                    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+                """))
+            with open(os.path.join(tests_dir, 'test_workers.py'), 'w') as f:
+                f.write(WORKERS_TEST)
+        if fast_start:
+            with open(os.path.join(tests_dir, 'test_import_time.py'), 'w') as f:
+                f.write(render_import_budget_test(import_budget_ms))
 
     # 7. Optional: include docs folder
     if include_docs:
@@ -207,35 +451,15 @@ def scaffold_project(
         os.makedirs(ci_dir, exist_ok=True)
         ci_path = os.path.join(ci_dir, 'ci.yml')
         with open(ci_path, 'w') as f:
-            f.write(textwrap.dedent(f"""
-                name: CI
-
-                on:
-                  push:
-                    branches: [ main ]
-                  pull_request:
-                    branches: [ main ]
-
-                jobs:
-                  test:
-                    runs-on: ubuntu-latest
-                    steps:
-                      - uses: actions/checkout@v3
-                      - name: Set up Python
-                        uses: actions/setup-python@v4
-                        with:
-                          python-version: '3.x'
-                      - name: Install dependencies
-                        run: |
-                          python -m pip install --upgrade pip
-                          pip install -r requirements.txt
-                          pip install pytest
-                      - name: Run tests
-                        run: pytest --maxfail=1 --disable-warnings -q
-            """))
+            f.write(render_ci_workflow(
+                python_versions=ci_python_versions,
+                cache_pip=ci_cache_pip,
+                parallel_tests=ci_parallel_tests
+            ))
 
     # 11. License file
     if license_type.upper() == 'MIT':
+        record.subprocesses += 1
         year = str(subprocess.check_output(['date', '+%Y']).decode().strip()) if os.name != 'nt' else str(os.popen('echo %date:~-4%').read().strip())
         with open(os.path.join(project_dir, 'LICENSE'), 'w') as f:
             f.write(textwrap.dedent(f"""
@@ -259,10 +483,92 @@ def scaffold_project(
                 SOFTWARE.
             """))
 
-    # 12. Initialize Git repository
+    # 12. Optional: copy a template project over the generated files
+    if template_dir:
+        copy_template(template_dir, project_dir, variables={
+            'project_name': project_name,
+            'description': description,
+            'author': author,
+            'gui_lib': gui_lib,
+        }, hardlink_assets=hardlink_assets)
+
+    # 13. Initialize Git repository
     if use_git:
         subprocess.check_call(['git', 'init'], cwd=project_dir)
         subprocess.check_call(['git', 'add', '.'], cwd=project_dir)
         subprocess.check_call(['git', 'commit', '-m', 'Initial commit'], cwd=project_dir)
+        record.subprocesses += 3
 
-    return project_dir
+
+# Top-level module each GUI choice imports, for checking it is installed in the venv
+GUI_MODULES = {'tkinter': 'tkinter', 'pyqt5': 'PyQt5', 'pyqt6': 'PyQt6'}
+
+# Import probe: prints "missing" when the toolkit is absent, else the import time of main.py
+_IMPORT_PROBE = """
+import sys, time, importlib.util
+if len(sys.argv) > 1 and importlib.util.find_spec(sys.argv[1]) is None:
+    print("missing")
+    sys.exit()
+t = time.perf_counter()
+import main
+print(time.perf_counter() - t)
+"""
+
+
+def warm_up_project(project_dir, gui_lib=None, workers=None, timeout=600):
+    """
+    Post-scaffold stage so the first launch is as fast as later ones.
+
+    Byte-compiles the project and the venv's site-packages in parallel with the
+    venv's own interpreter (so the .pyc tags match), then imports the generated
+    main.py without calling main() and measures how long the import took. The
+    import is skipped when gui_lib's toolkit is not installed in the venv (the
+    scaffold does not install PyQt), since it could only fail.
+    Returns a dict with 'compiled', 'import_time' (seconds or None), 'skipped'
+    (why the import was not tried, or None) and 'error'.
+    """
+    python = venv_python(os.path.join(project_dir, 'venv'))
+    report = {'compiled': False, 'import_time': None, 'skipped': None, 'error': None}
+    with track('warm_up', {'project_dir': project_dir}) as record:
+        if not os.path.isfile(python):
+            report['error'] = "No project venv to warm up"
+            record.exit_code = 1
+            return report
+        jobs = str(workers or os.cpu_count() or 1)
+
+        try:
+            # 1. Byte-compile the project sources (skipping venv/ and .git/) and site-packages
+            site_packages = subprocess.check_output(
+                [python, '-c', "import sysconfig; print(sysconfig.get_paths()['purelib'])"],
+                text=True, timeout=timeout
+            ).strip()
+            compile_runs = [
+                [python, '-m', 'compileall', '-q', '-j', jobs, '-x', r'[\\/](venv|\.git)([\\/]|$)', project_dir],
+                [python, '-m', 'compileall', '-q', '-j', jobs, site_packages],
+            ]
+            record.subprocesses += 1 + len(compile_runs)
+            codes = [subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                    timeout=timeout).returncode for cmd in compile_runs]
+            report['compiled'] = not any(codes)
+
+            # 2. Import smoke test; main() sits behind the __main__ guard so no window opens
+            module = GUI_MODULES.get(gui_lib)
+            probe = subprocess.run(
+                [python, '-c', _IMPORT_PROBE] + ([module] if module else []),
+                cwd=project_dir, capture_output=True, text=True, timeout=timeout
+            )
+            record.subprocesses += 1
+            output = probe.stdout.strip().splitlines()
+            if probe.returncode == 0 and output[-1:] == ["missing"]:
+                report['skipped'] = f"{module} is not installed in the venv; import test skipped"
+            elif probe.returncode == 0:
+                report['import_time'] = float(output[-1])
+            else:
+                lines = probe.stderr.strip().splitlines()
+                report['error'] = lines[-1] if lines else f"import exited with {probe.returncode}"
+        except (subprocess.SubprocessError, OSError) as e:
+            # a hung or broken venv interpreter must not escape into the caller's thread
+            report['error'] = str(e)
+        record.exit_code = 0 if report['compiled'] and report['error'] is None else 1
+        record.options['import_time'] = report['import_time']
+    return report
@@ -0,0 +1,190 @@
+"""
+Stress harness for scaffold_project: many concurrent scaffolds into one output folder.
+
+    python stress_scaffold.py --count 300 --workers 32 --mode process --distinct 10
+
+Names are unique by default; --distinct N makes the scaffolds share N names so they
+collide. Every scaffold must either succeed or fail cleanly, with ProjectLockedError
+(another scaffold is writing the folder) or ProjectExistsError (an earlier one already
+wrote it), and every project folder left behind must hold a complete, uncorrupted tree.
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+import telemetry
+from telemetry import percentile
+from setup_project import scaffold_project, ProjectLockedError, ProjectExistsError
+
+# Options used for every stress scaffold: everything that writes files, no venv or git
+STRESS_OPTIONS = dict(
+    description="Stress test project", author="stress", license_type="MIT", gui_lib="tkinter",
+    use_git=False, include_tests=True, include_ci=True, include_docs=True,
+    include_precommit=True, include_editorconfig=True, use_src=False, create_venv=False,
+)
+
+# Files STRESS_OPTIONS produce, relative to the project folder ({name} is the project name)
+EXPECTED_FILES = [
+    'main.py', 'README.md', '.gitignore', 'requirements.txt', 'LICENSE',
+    os.path.join('{name}', '__init__.py'), os.path.join('tests', 'test_sample.py'),
+    os.path.join('docs', 'index.md'), '.pre-commit-config.yaml', '.editorconfig',
+    os.path.join('.github', 'workflows', 'ci.yml'),
+]
+
+
+def project_names(count, distinct=None):
+    """count names, cycling over `distinct` of them when given (so they collide)."""
+    return [f"Stress{i % distinct if distinct else i}" for i in range(count)]
+
+
+def verify_project(project_dir, project_name):
+    """Return a list of problems with a stress project's tree (empty when it is complete)."""
+    problems = []
+    for rel in EXPECTED_FILES:
+        rel = rel.format(name=project_name)
+        if not os.path.isfile(os.path.join(project_dir, rel)):
+            problems.append(f"missing {rel}")
+    if problems:
+        return problems
+    with open(os.path.join(project_dir, 'main.py'), encoding='utf-8') as f:
+        source = f.read()
+    try:
+        compile(source, 'main.py', 'exec')
+    except SyntaxError as e:
+        problems.append(f"main.py does not compile: {e}")
+    if f'"{project_name}"' not in source:
+        problems.append("main.py belongs to another project")
+    with open(os.path.join(project_dir, 'README.md'), encoding='utf-8') as f:
+        if f.readline().rstrip('\n') != f"# {project_name}":
+            problems.append("README.md belongs to another project")
+    with open(os.path.join(project_dir, 'docs', 'index.md'), encoding='utf-8') as f:
+        if f.readline().rstrip('\n') != f"# {project_name} Documentation":
+            problems.append("docs/index.md belongs to another project")
+    for rel in ('LICENSE', '.gitignore', os.path.join('.github', 'workflows', 'ci.yml')):
+        if not os.path.getsize(os.path.join(project_dir, rel)):
+            problems.append(f"{rel} is empty")
+    return problems
+
+
+def _init_worker(telemetry_path):
+    # keep hundreds of stress records out of the user's operation history
+    telemetry.TELEMETRY_PATH = telemetry_path
+
+
+def _map(pool, jobs):
+    started = time.perf_counter()
+    with pool:
+        results = list(pool.map(_scaffold_one, jobs))
+    return results, time.perf_counter() - started
+
+
+def _scaffold_one(job):
+    """Run one scaffold; returns (name, status, latency, error) with status ok/locked/exists/failed."""
+    name, output_dir = job
+    started = time.perf_counter()
+    try:
+        scaffold_project(name, output_dir=output_dir, **STRESS_OPTIONS)
+        status, error = 'ok', None
+    except ProjectLockedError as e:
+        status, error = 'locked', str(e)
+    except ProjectExistsError as e:
+        status, error = 'exists', str(e)
+    except Exception as e:
+        status, error = 'failed', f"{type(e).__name__}: {e}"
+    return name, status, time.perf_counter() - started, error
+
+
+def run_stress(output_dir, count=200, workers=16, mode='thread', distinct=None):
+    """
+    Scaffold `count` projects into output_dir on `workers` threads or processes and
+    verify the result. Returns a dict with counts, throughput (successful projects per
+    second of wall time), latency percentiles, failures and incomplete trees.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    telemetry_path = os.path.join(output_dir, 'stress_telemetry.jsonl')
+    jobs = [(name, output_dir) for name in project_names(count, distinct)]
+    if mode == 'process':
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(telemetry_path,))
+        results, wall = _map(pool, jobs)
+    else:
+        # threads share this process's telemetry path, so point it back afterwards
+        saved_path = telemetry.TELEMETRY_PATH
+        _init_worker(telemetry_path)
+        try:
+            results, wall = _map(ThreadPoolExecutor(max_workers=workers), jobs)
+        finally:
+            telemetry.TELEMETRY_PATH = saved_path
+
+    latencies = [latency for _, status, latency, _ in results if status == 'ok']
+    succeeded = {name for name, status, _, _ in results if status == 'ok'}
+    incomplete = {}
+    for name in sorted(succeeded):
+        problems = verify_project(os.path.join(output_dir, name), name)
+        if problems:
+            incomplete[name] = problems
+    return {
+        'mode': mode,
+        'workers': workers,
+        'count': count,
+        'succeeded': len(latencies),
+        'locked': sum(1 for _, status, _, _ in results if status == 'locked'),
+        'exists': sum(1 for _, status, _, _ in results if status == 'exists'),
+        'failed': [(name, error) for name, status, _, error in results if status == 'failed'],
+        'incomplete': incomplete,
+        'wall': wall,
+        'projects_per_sec': len(latencies) / wall if wall else 0.0,
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+        'p99': percentile(latencies, 99),
+        'max': max(latencies) if latencies else None,
+    }
+
+
+def format_stress_report(result):
+    def ms(value):
+        return "-" if value is None else f"{value * 1000:.0f} ms"
+
+    kind = 'processes' if result['mode'] == 'process' else 'threads'
+    lines = [
+        f"{result['count']} scaffolds on {result['workers']} {kind} in {result['wall']:.2f}s "
+        f"({result['projects_per_sec']:.1f} projects/s)",
+        f"ok {result['succeeded']}, locked {result['locked']}, exists {result['exists']}, "
+        f"failed {len(result['failed'])}, "
+        f"incomplete {len(result['incomplete'])}",
+        f"latency p50 {ms(result['p50'])}, p95 {ms(result['p95'])}, p99 {ms(result['p99'])}, "
+        f"max {ms(result['max'])}",
+    ]
+    for name, error in result['failed'][:20]:
+        lines.append(f"  FAILED {name}: {error}")
+    for name, problems in list(result['incomplete'].items())[:20]:
+        lines.append(f"  INCOMPLETE {name}: {'; '.join(problems)}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run many concurrent scaffolds and check the results.")
+    parser.add_argument('--count', type=int, default=200)
+    parser.add_argument('--workers', type=int, default=16)
+    parser.add_argument('--mode', choices=('thread', 'process'), default='thread')
+    parser.add_argument('--distinct', type=int, default=None,
+                        help="share this many project names between the scaffolds (collisions)")
+    parser.add_argument('--output', default=None, help="output folder (default: a temporary folder)")
+    parser.add_argument('--keep', action='store_true', help="keep the generated projects")
+    args = parser.parse_args(argv)
+
+    output_dir = args.output or tempfile.mkdtemp(prefix='scaffold_stress_')
+    try:
+        result = run_stress(output_dir, args.count, args.workers, args.mode, args.distinct)
+        print(format_stress_report(result))
+    finally:
+        if not args.keep and not args.output:
+            shutil.rmtree(output_dir, ignore_errors=True)
+    return 1 if result['failed'] or result['incomplete'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,212 @@
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+
+
+# Operation history, one JSON record per line, next to the window-size config
+TELEMETRY_PATH = os.path.expanduser("~/.scaffolder_telemetry.jsonl")
+
+# A run is flagged when it takes this many times the historical median ...
+REGRESSION_FACTOR = 2.0
+# ... and only once there is enough history for the median to mean something
+MIN_HISTORY = 5
+
+# Once the history file grows past this size it is compacted ...
+MAX_HISTORY_BYTES = 2 * 1024 * 1024
+# ... down to the newest records of each operation
+KEEP_PER_OPERATION = 500
+# Regression checks and ETAs only read this much of the end of the file
+RECENT_BYTES = 256 * 1024
+
+_write_lock = threading.Lock()
+
+
+class OperationRecord:
+    """Mutable record handed out by track(); callers bump the counters as they go."""
+
+    def __init__(self, operation, options=None):
+        self.operation = operation
+        self.options = dict(options or {})
+        self.started_at = time.time()
+        self.duration = 0.0
+        self.subprocesses = 0
+        self.exit_code = None
+        self.bytes_written = 0
+        self.error = None
+        self.regression = False
+
+    def to_dict(self):
+        return {
+            'operation': self.operation,
+            'options': self.options,
+            'started_at': self.started_at,
+            'duration': self.duration,
+            'subprocesses': self.subprocesses,
+            'exit_code': self.exit_code,
+            'bytes_written': self.bytes_written,
+            'error': self.error,
+        }
+
+
+def append_record(record, path=None):
+    path = path or TELEMETRY_PATH
+    line = json.dumps(record, sort_keys=True, default=str)
+    with _write_lock:
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+            size = f.tell()
+        if size > MAX_HISTORY_BYTES:
+            compact_history(path)
+
+
+def compact_history(path=None, keep=None):
+    """
+    Rewrite the history keeping only the newest `keep` (default KEEP_PER_OPERATION)
+    records of each operation.
+    The new file replaces the old one atomically; a record appended by another
+    process during the rewrite may be lost, which is acceptable for timing history.
+    """
+    path = path or TELEMETRY_PATH
+    keep = keep or KEEP_PER_OPERATION
+    records = load_records(path=path)
+    counts = {}
+    kept = []
+    for record in reversed(records):
+        op = record.get('operation')
+        counts[op] = counts.get(op, 0) + 1
+        if counts[op] <= keep:
+            kept.append(record)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        for record in reversed(kept):
+            f.write(json.dumps(record, sort_keys=True, default=str) + '\n')
+    os.replace(tmp_path, path)
+
+
+def load_records(operation=None, path=None, recent=False):
+    """
+    Read the history, optionally for one operation; corrupt lines are skipped.
+    recent=True only reads the last RECENT_BYTES of the file, which is plenty for
+    medians and keeps per-operation checks cheap however large the history is.
+    """
+    records = []
+    try:
+        with open(path or TELEMETRY_PATH, 'rb') as f:
+            if recent:
+                f.seek(0, os.SEEK_END)
+                start = max(f.tell() - RECENT_BYTES, 0)
+                f.seek(start)
+                if start:
+                    f.readline()  # skip the partial first line
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if operation is None or record.get('operation') == operation:
+                    records.append(record)
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def percentile(values, pct):
+    """Linear-interpolated percentile of a list of numbers (pct in 0..100)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def is_regression(duration, history, factor=REGRESSION_FACTOR, min_history=MIN_HISTORY):
+    """True when duration is much slower than the median of successful past runs."""
+    past = [r['duration'] for r in history if r.get('exit_code') == 0]
+    if len(past) < min_history:
+        return False
+    return duration > factor * percentile(past, 50)
+
+
+@contextmanager
+def track(operation, options=None, path=None):
+    """
+    Time an operation and append its record to the history when the block exits.
+
+    An exception inside the block is recorded with a non-zero exit code and re-raised.
+    Telemetry problems (e.g. an unwritable home folder) never break the operation.
+    """
+    record = OperationRecord(operation, options)
+    start = time.monotonic()
+    try:
+        yield record
+    except Exception as e:
+        record.error = str(e)
+        if not record.exit_code:
+            record.exit_code = 1
+        raise
+    finally:
+        record.duration = time.monotonic() - start
+        if record.exit_code is None:
+            record.exit_code = 0
+        try:
+            if record.exit_code == 0:
+                record.regression = is_regression(record.duration, load_records(operation, path, recent=True))
+            append_record(record.to_dict(), path)
+        except Exception:
+            pass
+
+
+def typical_duration(operation, path=None):
+    """Median duration of past successful runs of operation, or None without history."""
+    durations = [r['duration'] for r in load_records(operation, path, recent=True) if r.get('exit_code') == 0]
+    return percentile(durations, 50)
+
+
+def summarize(records):
+    """Per-operation count, failure count and duration percentiles, sorted by operation."""
+    by_op = {}
+    for r in records:
+        by_op.setdefault(r.get('operation', '?'), []).append(r)
+    summary = []
+    for op in sorted(by_op):
+        runs = by_op[op]
+        durations = [r['duration'] for r in runs if r.get('exit_code') == 0]
+        summary.append({
+            'operation': op,
+            'runs': len(runs),
+            'failures': sum(1 for r in runs if r.get('exit_code') != 0),
+            'p50': percentile(durations, 50),
+            'p90': percentile(durations, 90),
+            'p99': percentile(durations, 99),
+            'last': runs[-1]['duration'],
+        })
+    return summary
+
+
+def find_regressions(records, factor=REGRESSION_FACTOR, min_history=MIN_HISTORY):
+    """Return the successful records that were much slower than the runs before them."""
+    flagged = []
+    history = {}
+    for r in records:
+        past = history.setdefault(r.get('operation'), [])
+        if r.get('exit_code') == 0 and is_regression(r['duration'], past, factor, min_history):
+            flagged.append(r)
+        past.append(r)
+    return flagged
+
+
+def directory_size(path, skip=('venv', '.git')):
+    """Total size in bytes of the files under path, ignoring the skipped folder names."""
+    total = 0
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames[:] = [d for d in dirnames if d not in skip]
+        for name in filenames:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, name))
+            except OSError:
+                pass
+    return total
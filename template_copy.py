@@ -0,0 +1,174 @@
+import os
+import re
+import errno
+import fnmatch
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Never copied out of a template project
+DEFAULT_IGNORE = [
+    '.git', '.hg', '.svn', '__pycache__', '*.py[cod]', 'venv', '.venv', 'node_modules',
+    'build', 'dist', '*.egg-info', '.pytest_cache', '.mypy_cache', '.DS_Store', 'Thumbs.db',
+]
+
+# Extra ignore patterns, one per line, can be listed in this file at the template root
+IGNORE_FILE = '.scaffoldignore'
+
+# Only these files get {{variable}} substitution; everything else is copied byte for byte
+TEXT_EXTENSIONS = {
+    '.py', '.pyi', '.md', '.rst', '.txt', '.toml', '.cfg', '.ini', '.yml', '.yaml', '.json',
+    '.spec', '.html', '.css', '.js', '.xml', '.qss', '.ui', '.sh', '.bat', '.ps1', '.in', '',
+}
+
+# Binary assets that are never edited in place and can safely share storage with the template.
+# Databases and text formats such as .svg are deliberately absent: a write through a hard
+# link would change the template and every project made from it.
+IMMUTABLE_EXTENSIONS = {
+    '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.icns', '.webp',
+    '.ttf', '.otf', '.woff', '.woff2', '.wav', '.mp3', '.ogg', '.mp4', '.zip',
+}
+
+_VARIABLE = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+_FICLONE = 0x40049409  # Linux ioctl that makes dst a copy-on-write clone of src
+
+
+def substitute(text, variables):
+    """Replace {{name}} placeholders; unknown names are left untouched."""
+    return _VARIABLE.sub(lambda m: str(variables.get(m.group(1), m.group(0))), text)
+
+
+def load_ignore_patterns(template_dir):
+    patterns = list(DEFAULT_IGNORE)
+    try:
+        with open(os.path.join(template_dir, IGNORE_FILE), encoding='utf-8') as f:
+            patterns += [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    except FileNotFoundError:
+        pass
+    patterns.append(IGNORE_FILE)
+    return patterns
+
+
+def _ignored(name, rel_path, patterns):
+    return any(fnmatch.fnmatch(name, p) or fnmatch.fnmatch(rel_path, p) for p in patterns)
+
+
+def _reflink(src, dst):
+    """Try a copy-on-write clone (btrfs, XFS, ...). Returns False when unsupported."""
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            return True
+        except OSError:
+            return False
+
+
+def _kernel_copy(src, dst):
+    """Copy inside the kernel with copy_file_range or sendfile. Returns False when unsupported."""
+    if hasattr(os, 'copy_file_range'):
+        copy = os.copy_file_range
+    elif hasattr(os, 'sendfile') and os.name != 'nt':
+        def copy(fin, fout, count):
+            return os.sendfile(fout, fin, None, count)
+    else:
+        return False
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        try:
+            while remaining > 0:
+                sent = copy(fsrc.fileno(), fdst.fileno(), min(remaining, 1 << 30))
+                if sent == 0:
+                    break
+                remaining -= sent
+        except OSError as e:
+            if e.errno in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF):
+                return False
+            raise
+    return remaining <= 0
+
+
+def fast_copy(src, dst, hardlink=False):
+    """
+    Copy one file as cheaply as the platform allows and return the method used:
+    'hardlink', 'reflink', 'kernel' or 'copy'.
+    """
+    if hardlink:
+        try:
+            os.link(src, dst)
+            return 'hardlink'
+        except OSError:
+            pass
+    if _reflink(src, dst):
+        method = 'reflink'
+    elif _kernel_copy(src, dst):
+        method = 'kernel'
+    else:
+        shutil.copyfile(src, dst)
+        method = 'copy'
+    shutil.copymode(src, dst)
+    return method
+
+
+def _copy_one(src, dst, variables, hardlink_assets):
+    ext = os.path.splitext(src)[1].lower()
+    if os.path.exists(dst) or os.path.islink(dst):
+        os.remove(dst)
+    if ext in TEXT_EXTENSIONS:
+        try:
+            with open(src, encoding='utf-8') as f:
+                text = f.read()
+        except UnicodeDecodeError:
+            pass  # not really text; fall through to a byte copy
+        else:
+            new_text = substitute(text, variables)
+            if new_text != text:
+                with open(dst, 'w', encoding='utf-8', newline='') as f:
+                    f.write(new_text)
+                shutil.copymode(src, dst)
+                return 'substituted'
+    return fast_copy(src, dst, hardlink=hardlink_assets and ext in IMMUTABLE_EXTENSIONS)
+
+
+def copy_template(template_dir, dest_dir, variables=None, hardlink_assets=False, max_workers=None):
+    """
+    Copy a reference project tree into dest_dir, replacing {{name}} placeholders in
+    text files and in file/folder names. Existing files in dest_dir are overwritten.
+
+    The directory walk is done up front, then files are copied in parallel on a thread
+    pool (the copies are I/O bound and mostly happen in the kernel). Returns a dict
+    counting files per copy method plus 'files' and 'bytes' totals.
+    """
+    variables = variables or {}
+    template_dir = os.path.abspath(template_dir)
+    if not os.path.isdir(template_dir):
+        raise FileNotFoundError(f"Template folder not found: {template_dir}")
+    patterns = load_ignore_patterns(template_dir)
+
+    jobs = []
+    total_bytes = 0
+    for dirpath, dirnames, filenames in os.walk(template_dir):
+        rel_dir = os.path.relpath(dirpath, template_dir)
+        rel_dir = '' if rel_dir == '.' else rel_dir
+        dirnames[:] = [d for d in dirnames
+                       if not _ignored(d, os.path.join(rel_dir, d).replace(os.sep, '/'), patterns)]
+        out_dir = os.path.join(dest_dir, substitute(rel_dir, variables))
+        os.makedirs(out_dir, exist_ok=True)
+        for name in filenames:
+            if _ignored(name, os.path.join(rel_dir, name).replace(os.sep, '/'), patterns):
+                continue
+            src = os.path.join(dirpath, name)
+            if os.path.islink(src) or not os.path.isfile(src):
+                continue
+            total_bytes += os.path.getsize(src)
+            jobs.append((src, os.path.join(out_dir, substitute(name, variables))))
+
+    stats = {'files': len(jobs), 'bytes': total_bytes}
+    max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for method in pool.map(lambda job: _copy_one(job[0], job[1], variables, hardlink_assets), jobs):
+            stats[method] = stats.get(method, 0) + 1
+    return stats
@@ -11,3 +11,13 @@ from main import ScaffoldApp
 # Stub out GUI init/destroy so tests don't load Tcl/Tk
 ScaffoldApp.__init__ = lambda self: None
 ScaffoldApp.destroy  = lambda self: None
+
+import pytest
+import telemetry
+
+
+@pytest.fixture(autouse=True)
+def isolated_telemetry(tmp_path, monkeypatch):
+    # Keep operation records written during tests out of the user's home folder
+    monkeypatch.setattr(telemetry, 'TELEMETRY_PATH', str(tmp_path / "telemetry.jsonl"))
+    yield
@@ -0,0 +1,79 @@
+import os
+import sys
+import time
+import subprocess
+
+import pytest
+
+from build_env import ensure_build_env, find_project_root, fingerprint, base_python, BUILD_ENV_DIR
+from fleet_upgrade import venv_python
+from telemetry import load_records
+
+
+def _project(tmp_path, requirements="# Add your project dependencies here\n"):
+    project = tmp_path / "App"
+    (project / "pkg").mkdir(parents=True)
+    (project / "requirements.txt").write_text(requirements)
+    (project / "main.py").write_text("print('hi')\n")
+    return project
+
+
+def test_find_project_root_walks_up_to_requirements(tmp_path):
+    project = _project(tmp_path)
+    script = project / "pkg" / "tool.py"
+    script.write_text("")
+    assert find_project_root(str(script)) == str(project)
+    loose = tmp_path / "loose.py"
+    loose.write_text("")
+    assert find_project_root(str(loose)) == str(tmp_path)
+
+
+def test_fingerprint_tracks_requirements_and_packages(tmp_path):
+    project = _project(tmp_path)
+    first = fingerprint(str(project))
+    assert fingerprint(str(project)) == first
+    (project / "requirements.txt").write_text("requests\n")
+    assert fingerprint(str(project)) != first
+    assert fingerprint(str(project), packages=()) != fingerprint(str(project))
+
+
+def test_base_python_prefers_project_venv(tmp_path):
+    project = _project(tmp_path)
+    assert base_python(str(project)) == sys.executable
+    venv_dir = project / "venv"
+    os.makedirs(os.path.dirname(venv_python(str(venv_dir))))
+    (venv_dir / "pyvenv.cfg").write_text("home = /usr/bin\n")
+    open(venv_python(str(venv_dir)), 'w').close()
+    assert base_python(str(project)) == venv_python(str(venv_dir))
+
+
+def test_build_env_is_cached_until_requirements_change(tmp_path):
+    project = _project(tmp_path)
+    # no packages and no real requirements: builds the venv only, so no network is needed
+    python, rebuilt = ensure_build_env(str(project), packages=())
+    assert rebuilt
+    assert python == venv_python(str(project / BUILD_ENV_DIR))
+    assert os.path.isfile(python)
+
+    marker = project / BUILD_ENV_DIR / "marker"
+    marker.write_text("")
+    assert ensure_build_env(str(project), packages=()) == (python, False)
+    assert marker.exists()
+
+    (project / "requirements.txt").write_text("# pinned nothing yet\n")
+    assert ensure_build_env(str(project), packages=())[1]
+    assert not marker.exists()
+    assert len(load_records('build_env')) == 2
+
+
+def test_hung_build_step_times_out_while_output_is_still_open(tmp_path, monkeypatch):
+    # every step is replaced by one that prints and then hangs with stdout still open
+    popen = subprocess.Popen
+    hang = [sys.executable, '-c', "import time; print('working', flush=True); time.sleep(60)"]
+    monkeypatch.setattr(subprocess, 'Popen', lambda cmd, **kwargs: popen(hang, **kwargs))
+    lines = []
+    started = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired):
+        ensure_build_env(str(tmp_path), on_output=lines.append, timeout=1)
+    assert time.monotonic() - started < 30
+    assert lines[-1] == 'working'
@@ -0,0 +1,45 @@
+import pytest
+
+from setup_project import render_ci_workflow, DEFAULT_CI_PYTHON
+
+
+def test_default_workflow_is_single_job():
+    """Without options the workflow runs pytest once on the default Python."""
+    ci = render_ci_workflow()
+    assert f"python-version: '{DEFAULT_CI_PYTHON}'" in ci
+    assert "matrix" not in ci
+    assert "cache:" not in ci
+    assert "pytest-xdist" not in ci
+    assert "run: pytest --maxfail=1 --disable-warnings -q\n" in ci
+
+
+def test_pip_cache_keyed_on_requirements():
+    ci = render_ci_workflow(cache_pip=True)
+    assert "cache: 'pip'" in ci
+    assert "cache-dependency-path: requirements.txt" in ci
+
+
+def test_parallel_tests_use_xdist():
+    ci = render_ci_workflow(parallel_tests=True)
+    assert "pip install pytest pytest-xdist" in ci
+    assert "-n auto" in ci
+
+
+def test_python_version_matrix():
+    ci = render_ci_workflow(python_versions=["3.10", " 3.11 ", ""])
+    assert "python-version: ['3.10', '3.11']" in ci
+    assert "python-version: '${{ matrix.python-version }}'" in ci
+    assert f"python-version: '{DEFAULT_CI_PYTHON}'" not in ci
+
+
+def test_rendered_workflow_is_valid_yaml():
+    yaml = pytest.importorskip("yaml")
+    doc = yaml.safe_load(render_ci_workflow(
+        python_versions=["3.11", "3.12"], cache_pip=True, parallel_tests=True
+    ))
+    job = doc["jobs"]["test"]
+    assert job["strategy"]["matrix"]["python-version"] == ["3.11", "3.12"]
+    setup = job["steps"][1]["with"]
+    assert setup["cache"] == "pip"
+    assert setup["cache-dependency-path"] == "requirements.txt"
+    assert job["steps"][-1]["run"].endswith("-n auto")
@@ -0,0 +1,26 @@
+from main import ScaffoldApp
+
+
+class FakeVar:
+    def __init__(self, value=None):
+        self.value = value
+
+    def set(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+def test_new_project_restores_default_options():
+    app = ScaffoldApp()  # __init__ is stubbed out in conftest
+    flags = ['git', 'tests', 'src', 'ci_cache', 'ci_parallel', 'warmup', 'responsive', 'asyncio', 'fast_start', 'hardlink']
+    app.options = {flag: FakeVar(True) for flag in flags}
+    for name in ('project_name', 'output_folder', 'template_folder', 'gui_lib', 'license_type', 'ci_python_versions'):
+        setattr(app, name, FakeVar())
+    app._clear_log = lambda: None
+
+    app._clear_form()
+
+    off = {flag for flag, var in app.options.items() if not var.get()}
+    assert off == {'src', 'ci_parallel', 'warmup', 'responsive', 'asyncio', 'fast_start', 'hardlink'}
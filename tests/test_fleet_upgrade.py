@@ -0,0 +1,92 @@
+import json
+import os
+import subprocess
+
+import fleet_upgrade
+from fleet_upgrade import find_project_venvs, venvs_for_projects, upgrade_venv, upgrade_fleet, format_fleet_report
+
+
+def make_venv(path):
+    os.makedirs(path, exist_ok=True)
+    open(os.path.join(path, 'pyvenv.cfg'), 'w').close()
+    python = fleet_upgrade.venv_python(path)
+    os.makedirs(os.path.dirname(python), exist_ok=True)
+    open(python, 'w').close()
+    return str(path)
+
+
+def test_find_project_venvs(tmp_path):
+    a = make_venv(tmp_path / "AppA" / "venv")
+    b = make_venv(tmp_path / "group" / "AppB" / "venv")
+    # packages inside a venv must not be reported as extra venvs
+    make_venv(tmp_path / "AppA" / "venv" / "nested")
+    make_venv(tmp_path / "too" / "deep" / "for" / "search" / "venv")
+
+    assert find_project_venvs(str(tmp_path)) == sorted([a, b])
+
+
+def test_venvs_for_projects_skips_projects_without_venv(tmp_path):
+    a = make_venv(tmp_path / "AppA" / "venv")
+    (tmp_path / "AppB").mkdir()
+    assert venvs_for_projects([str(tmp_path / "AppA"), str(tmp_path / "AppB")]) == [a]
+
+
+def fake_pip(outdated, install_rc=0, calls=None):
+    def run(cmd, **kwargs):
+        if calls is not None:
+            calls.append(cmd)
+        if 'list' in cmd:
+            return subprocess.CompletedProcess(cmd, 0, json.dumps(outdated), "")
+        return subprocess.CompletedProcess(cmd, install_rc, "", "boom" if install_rc else "")
+    return run
+
+
+def test_upgrade_venv_installs_all_outdated_in_one_call(tmp_path, monkeypatch):
+    venv = make_venv(tmp_path / "venv")
+    calls = []
+    outdated = [{'name': 'requests', 'version': '2.0', 'latest_version': '2.32'},
+                {'name': 'idna', 'version': '2.0', 'latest_version': '3.7'}]
+    monkeypatch.setattr(fleet_upgrade.subprocess, 'run', fake_pip(outdated, calls=calls))
+
+    report = upgrade_venv(venv)
+    assert report['error'] is None
+    assert report['upgraded'] == ['requests', 'idna']
+    installs = [c for c in calls if 'install' in c]
+    assert len(installs) == 1 and installs[0][-2:] == ['requests', 'idna']
+
+
+def test_upgrade_venv_filters_packages_and_reports_failures(tmp_path, monkeypatch):
+    venv = make_venv(tmp_path / "venv")
+    outdated = [{'name': 'requests', 'version': '2.0', 'latest_version': '2.32'},
+                {'name': 'idna', 'version': '2.0', 'latest_version': '3.7'}]
+    monkeypatch.setattr(fleet_upgrade.subprocess, 'run', fake_pip(outdated, install_rc=1))
+
+    report = upgrade_venv(venv, packages=['IDNA'])
+    assert [p['name'] for p in report['outdated']] == ['idna']
+    assert report['upgraded'] == []
+    assert report['error'] == "boom"
+
+
+def test_upgrade_venv_without_interpreter(tmp_path):
+    report = upgrade_venv(str(tmp_path / "missing"))
+    assert "No interpreter" in report['error']
+
+
+def test_upgrade_fleet_keeps_input_order_and_reports(monkeypatch):
+    seen = []
+
+    def fake_upgrade(venv, packages, dry_run):
+        if venv == 'bad':
+            return {'venv': venv, 'outdated': [], 'upgraded': [], 'error': 'broken', 'duration': 0.0}
+        return {'venv': venv, 'outdated': [{'name': 'pip', 'version': '1', 'latest': '2'}],
+                'upgraded': ['pip'], 'error': None, 'duration': 0.1}
+
+    monkeypatch.setattr(fleet_upgrade, 'upgrade_venv', fake_upgrade)
+    venvs = [f"v{i}" for i in range(10)] + ['bad']
+    reports = upgrade_fleet(venvs, max_workers=4, on_result=seen.append)
+
+    assert [r['venv'] for r in reports] == venvs
+    assert len(seen) == len(venvs)
+    summary = format_fleet_report(reports)
+    assert summary.splitlines()[0] == "Fleet upgrade: 11 venv(s), 10 upgraded, 0 up-to-date, 1 failed"
+    assert "FAILED bad: broken" in summary
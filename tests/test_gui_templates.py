@@ -0,0 +1,116 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from gui_templates import render_responsive_main, render_fast_start_main, LAZY_IMPORT_MODULE
+from setup_project import scaffold_project
+
+
+@pytest.mark.parametrize('gui_lib', ['tkinter', 'pyqt5', 'pyqt6'])
+@pytest.mark.parametrize('use_asyncio', [False, True])
+def test_responsive_main_compiles(gui_lib, use_asyncio):
+    source = render_responsive_main(gui_lib, "Demo", use_asyncio)
+    compile(source, 'main.py', 'exec')
+    assert "from workers import TaskRunner, long_task" in source
+    assert ("long_async_task" in source) == use_asyncio
+    assert 'if __name__ == \'__main__\':' in source
+
+
+def test_qt_variants_use_thread_pool_and_signals():
+    for gui_lib, exec_call in (('pyqt5', 'exec_()'), ('pyqt6', 'exec()')):
+        source = render_responsive_main(gui_lib, "Demo")
+        assert "QThreadPool.globalInstance().start" in source
+        assert "pyqtSignal" in source
+        assert f"app.{exec_call}" in source
+
+
+def test_tk_variant_polls_queue_with_after():
+    source = render_responsive_main('tkinter', "Demo")
+    assert "queue.Queue()" in source
+    assert "root.after(self.POLL_MS" in source
+
+
+def test_scaffold_responsive_project(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, 'frozen', True, raising=False)  # skip venv creation
+    project_dir = scaffold_project(
+        project_name="RespApp", description="d", author="a", license_type="None",
+        gui_lib="tkinter", use_git=False, include_tests=True, include_ci=False,
+        include_docs=False, include_precommit=False, include_editorconfig=False,
+        use_src=False, output_dir=str(tmp_path), responsive_ui=True, use_asyncio=True
+    )
+    assert os.path.isfile(os.path.join(project_dir, "workers.py"))
+    with open(os.path.join(project_dir, "main.py")) as f:
+        assert "TaskRunner" in f.read()
+
+    # the generated project's own tests exercise the worker pool and asyncio loop
+    result = subprocess.run([sys.executable, '-m', 'pytest', '-q', '-p', 'no:cacheprovider', 'tests'],
+                            cwd=project_dir, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "3 passed" in result.stdout
+
+
+@pytest.mark.parametrize('gui_lib', ['tkinter', 'pyqt5', 'pyqt6'])
+def test_fast_start_main_defers_gui_imports(gui_lib, tmp_path):
+    (tmp_path / "lazy_import.py").write_text(LAZY_IMPORT_MODULE)
+    (tmp_path / "main.py").write_text(render_fast_start_main(gui_lib, "Demo"))
+    probe = ("import sys, main; "
+             "print([m for m in sys.modules if m.split('.')[0] in ('tkinter', '_tkinter', 'PyQt5', 'PyQt6')])")
+    out = subprocess.check_output([sys.executable, '-c', probe], cwd=tmp_path, text=True)
+    assert out.strip() == '[]'
+
+
+def test_lazy_import_defers_execution(tmp_path, monkeypatch):
+    (tmp_path / "lazy_import.py").write_text(LAZY_IMPORT_MODULE)
+    (tmp_path / "heavy_mod.py").write_text("import builtins\nbuiltins.heavy_loaded = True\nVALUE = 42\n")
+    probe = ("import builtins; from lazy_import import lazy_import, load_now; m = lazy_import('heavy_mod'); "
+             "print(hasattr(builtins, 'heavy_loaded')); load_now(m); print(builtins.heavy_loaded); print(m.VALUE)")
+    out = subprocess.check_output([sys.executable, '-c', probe], cwd=tmp_path, text=True)
+    assert out.split() == ['False', 'True', '42']
+
+
+def test_fast_start_main_binds_deferred_modules_without_running_them(tmp_path):
+    (tmp_path / "lazy_import.py").write_text(LAZY_IMPORT_MODULE)
+    (tmp_path / "main.py").write_text(render_fast_start_main('pyqt6', "Demo"))
+    probe = ("import sys, main; print(type(main.json).__name__); "
+             "main.load_deferred(); print(type(main.json).__name__, callable(main.json.dumps))")
+    out = subprocess.check_output([sys.executable, '-c', probe], cwd=tmp_path, text=True)
+    assert out.split() == ['_LazyModule', 'module', 'True']
+
+
+def test_fast_start_and_responsive_ui_are_rejected(tmp_path, monkeypatch):
+    with pytest.raises(ValueError):
+        _scaffold_fast_start(tmp_path, monkeypatch, budget=300, responsive_ui=True)
+    assert not (tmp_path / "FastApp").exists()
+
+
+def _scaffold_fast_start(tmp_path, monkeypatch, budget, **extra):
+    monkeypatch.setattr(sys, 'frozen', True, raising=False)  # skip venv creation
+    return scaffold_project(
+        project_name="FastApp", description="d", author="a", license_type="None",
+        gui_lib="pyqt6", use_git=False, include_tests=True, include_ci=False,
+        include_docs=False, include_precommit=False, include_editorconfig=False,
+        use_src=False, output_dir=str(tmp_path), fast_start=True, import_budget_ms=budget, **extra
+    )
+
+
+def test_scaffold_fast_start_project_meets_budget(tmp_path, monkeypatch):
+    project_dir = _scaffold_fast_start(tmp_path, monkeypatch, budget=2000)
+    assert os.path.isfile(os.path.join(project_dir, "lazy_import.py"))
+    # PyQt6 need not be installed: importing main must not touch it
+    result = subprocess.run([sys.executable, '-m', 'pytest', '-q', '-p', 'no:cacheprovider', 'tests'],
+                            cwd=project_dir, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "2 passed" in result.stdout
+
+
+def test_import_budget_test_fails_when_exceeded(tmp_path, monkeypatch):
+    project_dir = _scaffold_fast_start(tmp_path, monkeypatch, budget=0)
+    with open(os.path.join(project_dir, "main.py"), 'a') as f:
+        f.write("\nimport time\ntime.sleep(0.05)\n")
+    result = subprocess.run([sys.executable, '-m', 'pytest', '-q', '-p', 'no:cacheprovider',
+                             'tests/test_import_time.py'],
+                            cwd=project_dir, capture_output=True, text=True, timeout=120)
+    assert result.returncode != 0
+    assert "budget is 0 ms" in result.stdout
@@ -0,0 +1,79 @@
+import os
+
+from log_view import SpillingLogBuffer
+
+
+def make_buffer(tmp_path, **kwargs):
+    return SpillingLogBuffer(str(tmp_path / "logs" / "log.txt"), **kwargs)
+
+
+def test_memory_is_bounded_and_old_lines_spill(tmp_path):
+    buf = make_buffer(tmp_path, max_lines=100)
+    for i in range(1000):
+        buf.append(f"line {i}")
+    assert len(buf) == 1000
+    assert buf.first_in_memory == 900
+    assert len(buf._lines) == 100
+    assert buf.get_range(995, 10) == [f"line {i}" for i in range(995, 1000)]
+    # spilled lines are not served from memory
+    assert buf.get_range(0, 5) == []
+    # closing spills what is still in memory as well
+    buf.close()
+    with open(buf.spill_path) as f:
+        assert f.read().splitlines() == [f"line {i}" for i in range(1000)]
+
+
+def test_search_covers_spilled_and_memory_lines(tmp_path):
+    buf = make_buffer(tmp_path, max_lines=10)
+    for i in range(50):
+        buf.append(f"step {i} {'ERROR' if i % 20 == 3 else 'ok'}")
+    hits = buf.search("error")
+    assert hits == [(3, "step 3 ERROR"), (23, "step 23 ERROR"), (43, "step 43 ERROR")]
+    assert buf.search("ERROR", case_sensitive=True, limit=2) == hits[:2]
+
+
+def test_spill_file_rotates(tmp_path):
+    buf = make_buffer(tmp_path, max_lines=1, max_spill_bytes=200, backups=2)
+    for i in range(200):
+        buf.append(f"{i:04d} " + "x" * 20)
+    buf.close()
+    files = buf._spill_files()
+    assert len(files) <= 3
+    total = sum(os.path.getsize(f) for f in files)
+    assert total < 3 * 230
+    # the newest spilled line is still searchable
+    assert buf.search("0198")[0][1].startswith("0198")
+
+
+def test_previous_session_becomes_backup(tmp_path):
+    first = make_buffer(tmp_path, max_lines=1)
+    first.append("old session")
+    first.append("trigger spill")
+    first.close()
+
+    second = make_buffer(tmp_path, max_lines=1)
+    assert len(second) == 0
+    assert second.search("old session") == [(None, "old session")]
+
+
+def test_last_lines_are_searchable_after_restart(tmp_path):
+    first = make_buffer(tmp_path, max_lines=100)
+    for i in range(10):
+        first.append(f"entry {i}")
+    first.append("last line before exit")
+    first.close()
+
+    second = make_buffer(tmp_path, max_lines=100)
+    assert second.search("last line before exit") == [(None, "last line before exit")]
+    assert len(second.search("entry")) == 10
+
+
+def test_multiline_append_and_clear(tmp_path):
+    buf = make_buffer(tmp_path, max_lines=2)
+    buf.append("a\nb\nc")
+    assert len(buf) == 3
+    assert buf.get_range(0, 3) == ["b", "c"]
+    buf.clear()
+    assert len(buf) == 0
+    assert buf.search("a") == []
+    assert buf._spill_files() == []
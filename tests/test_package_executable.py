@@ -0,0 +1,24 @@
+import threading
+
+import main
+from main import ScaffoldApp
+
+
+def test_packaging_runs_off_the_gui_thread(monkeypatch):
+    monkeypatch.setattr(main.sys, 'frozen', False, raising=False)
+    app = ScaffoldApp()  # __init__ is stubbed out in conftest
+    app._ask_package_target = lambda: ("app.py", "App", "dist")
+    ran = threading.Event()
+    threads = []
+
+    def run_package(entry_script, exe_name, dest_folder):
+        threads.append((threading.current_thread(), entry_script, exe_name, dest_folder))
+        ran.set()
+
+    app._run_package = run_package
+    app._package_executable()
+
+    assert ran.wait(5)
+    [(thread, *target)] = threads
+    assert thread is not threading.main_thread()
+    assert target == ["app.py", "App", "dist"]
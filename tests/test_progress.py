@@ -0,0 +1,90 @@
+import pytest
+
+from progress import (PipProgressParser, PyInstallerProgressParser, EtaEstimator,
+                      parse_size, format_eta)
+
+PIP_OUTPUT = """\
+Collecting requests
+  Downloading requests-2.32.3-py3-none-any.whl (64 kB)
+Collecting idna<4,>=2.5
+  Using cached idna-3.7-py3-none-any.whl (66 kB)
+Requirement already satisfied: certifi>=2017.4.17 in ./venv/lib/python3.11/site-packages
+Collecting urllib3<3,>=1.21.1
+  Downloading urllib3-2.2.2-py3-none-any.whl (1.2 MB)
+Installing collected packages: urllib3, idna, requests
+Successfully installed idna-3.7 requests-2.32.3 urllib3-2.2.2
+"""
+
+PYINSTALLER_OUTPUT = """\
+123 INFO: PyInstaller: 6.8.0, contrib hooks: 2024.7
+124 INFO: Python: 3.11.7
+300 INFO: Initializing module dependency graph...
+410 INFO: Running Analysis Analysis-00.toc
+500 INFO: Processing standard module hook 'hook-encodings.py'
+520 INFO: Looking for dynamic libraries
+5000 INFO: Building PYZ (ZlibArchive) build/PYZ-00.pyz
+6000 INFO: Building PKG (CArchive) main.pkg
+7000 INFO: Building EXE from EXE-00.toc
+8000 INFO: Build complete! The results are available in: dist
+"""
+
+
+def feed_all(parser, text):
+    return [e for e in (parser.feed(line) for line in text.splitlines()) if e]
+
+
+def test_parse_size():
+    assert parse_size("64 kB") == 64000
+    assert parse_size("1.2 MB") == 1200000
+    assert parse_size("3 MiB") == 3 * 2 ** 20
+    assert parse_size("unknown") == 0
+
+
+def test_pip_parser_phases_and_bytes():
+    events = feed_all(PipProgressParser(), PIP_OUTPUT)
+    phases = [e.phase for e in events]
+    assert phases[0] == 'collecting'
+    assert 'downloading' in phases
+    assert phases[-2:] == ['installing', 'done']
+    fractions = [e.fraction for e in events]
+    assert fractions == sorted(fractions)
+    assert fractions[-1] == 1.0
+    assert events[-1].bytes_done == 64000 + 1200000
+
+
+def test_pip_parser_reports_errors():
+    event = PipProgressParser().feed("ERROR: No matching distribution found for nope")
+    assert event.phase == 'error'
+    assert event.fraction is None
+
+
+def test_pyinstaller_parser_walks_phases_in_order():
+    events = feed_all(PyInstallerProgressParser(), PYINSTALLER_OUTPUT)
+    phases = []
+    for e in events:
+        if not phases or phases[-1] != e.phase:
+            phases.append(e.phase)
+    assert phases == ['starting', 'analysis', 'pyz', 'pkg', 'exe', 'done']
+    fractions = [e.fraction for e in events]
+    assert fractions == sorted(fractions)
+    assert max(e.fraction for e in events if e.phase == 'analysis') < 0.7
+
+
+def test_pyinstaller_parser_ignores_noise():
+    assert PyInstallerProgressParser().feed("124 INFO: Python: 3.11.7") is None
+
+
+def test_eta_estimator():
+    now = [0.0]
+    eta = EtaEstimator(expected=100, clock=lambda: now[0])
+    now[0] = 10.0
+    assert eta.eta(0.0) == 90
+    assert eta.eta(0.5) == pytest.approx(10)
+    assert eta.eta(1.0) == 0
+    assert EtaEstimator().eta(0.01) is None
+
+
+def test_format_eta():
+    assert format_eta(None) == "estimating…"
+    assert format_eta(42.4) == "42s left"
+    assert format_eta(125) == "2m 05s left"
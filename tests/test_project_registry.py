@@ -0,0 +1,100 @@
+import pytest
+
+from project_registry import ProjectRegistry
+
+
+@pytest.fixture
+def registry(tmp_path):
+    return ProjectRegistry(db_path=str(tmp_path / "projects.db"))
+
+
+def test_record_and_get(registry, tmp_path):
+    path = registry.record(str(tmp_path / "Alpha"), "Alpha", {'gui_lib': 'tkinter', 'ci': True})
+    entry = registry.get(path)
+    assert entry['name'] == "Alpha"
+    assert entry['options'] == {'gui_lib': 'tkinter', 'ci': True}
+    assert entry['created_at'] == entry['last_opened_at']
+
+
+def test_record_same_path_updates_instead_of_duplicating(registry, tmp_path):
+    path = str(tmp_path / "Alpha")
+    registry.record(path, "Alpha", {'ci': False})
+    registry.record(path, "Alpha", {'ci': True})
+    results = registry.search()
+    assert len(results) == 1
+    assert results[0]['options'] == {'ci': True}
+
+
+def test_search_filters_and_orders_by_last_opened(registry, tmp_path):
+    alpha = registry.record(str(tmp_path / "Alpha"), "Alpha")
+    registry.record(str(tmp_path / "Beta"), "Beta")
+    registry.record(str(tmp_path / "AlphaTwo"), "AlphaTwo")
+    registry.touch(alpha)
+
+    assert [e['name'] for e in registry.search("alpha")] == ["Alpha", "AlphaTwo"]
+    assert [e['name'] for e in registry.search("beta")] == ["Beta"]
+    assert registry.most_recent()['path'] == alpha
+
+
+def test_registry_persists_across_instances(tmp_path):
+    db_path = str(tmp_path / "projects.db")
+    ProjectRegistry(db_path).record(str(tmp_path / "Alpha"), "Alpha")
+    assert ProjectRegistry(db_path).most_recent()['name'] == "Alpha"
+
+
+def test_liveness_is_checked_on_demand(registry, tmp_path):
+    live = tmp_path / "Live"
+    live.mkdir()
+    registry.record(str(live), "Live")
+    registry.record(str(tmp_path / "Gone"), "Gone")
+
+    alive = {e['name']: registry.is_alive(e['path']) for e in registry.search()}
+    assert alive == {'Live': True, 'Gone': False}
+
+    registry.remove(str(tmp_path / "Gone"))
+    assert [e['name'] for e in registry.search()] == ["Live"]
+
+
+def test_every_call_closes_its_connection(tmp_path, monkeypatch):
+    import sqlite3
+    opened = []
+
+    class TrackingConnection(sqlite3.Connection):
+        closed = False
+
+        def close(self):
+            self.closed = True
+            super().close()
+
+    real_connect = sqlite3.connect
+
+    def connect(*args, **kwargs):
+        conn = real_connect(*args, factory=TrackingConnection, **kwargs)
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(sqlite3, 'connect', connect)
+    registry = ProjectRegistry(db_path=str(tmp_path / "projects.db"))
+    path = registry.record(str(tmp_path / "Alpha"), "Alpha")
+    registry.touch(path)
+    registry.search("alp")
+    registry.get(path)
+    registry.remove(path)
+    assert len(opened) == 6
+    assert all(conn.closed for conn in opened)
+
+
+def test_search_matches_wildcards_literally(registry, tmp_path):
+    registry.record(str(tmp_path / "my_app"), "my_app")
+    registry.record(str(tmp_path / "myXapp"), "myXapp")
+    registry.record(str(tmp_path / "100%"), "100%")
+    assert [e['name'] for e in registry.search("my_")] == ["my_app"]
+    assert [e['name'] for e in registry.search("0%")] == ["100%"]
+
+
+def test_count_reports_matches_beyond_the_limit(registry, tmp_path):
+    for i in range(5):
+        registry.record(str(tmp_path / f"App{i}"), f"App{i}")
+    assert len(registry.search("app", limit=3)) == 3
+    assert registry.count("app") == 5
+    assert registry.count("app3") == 1
@@ -0,0 +1,140 @@
+import os
+import sys
+import time
+import signal
+import threading
+import subprocess
+
+import pytest
+
+import telemetry
+
+from setup_project import scaffold_project, project_lock, ProjectLockedError, ProjectExistsError, lock_path
+from stress_scaffold import run_stress, verify_project, project_names, format_stress_report, STRESS_OPTIONS
+
+
+def test_project_names_collide_only_when_asked():
+    assert len(set(project_names(10))) == 10
+    assert set(project_names(10, distinct=3)) == {"Stress0", "Stress1", "Stress2"}
+
+
+def test_locked_project_fails_cleanly(tmp_path):
+    project_dir = tmp_path / "Stress0"
+    with project_lock(str(project_dir)):
+        with pytest.raises(ProjectLockedError):
+            scaffold_project("Stress0", output_dir=str(tmp_path), **STRESS_OPTIONS)
+    assert not os.path.exists(lock_path(str(project_dir)))
+    # once released the same folder can be scaffolded again
+    scaffold_project("Stress0", output_dir=str(tmp_path), **STRESS_OPTIONS)
+    assert verify_project(str(project_dir), "Stress0") == []
+
+
+def test_leftover_lock_file_is_not_stale_lock(tmp_path):
+    # a lock file left by a crashed scaffold holds no OS lock, so it is simply reused
+    project_dir = str(tmp_path / "Leftover")
+    open(lock_path(project_dir), 'w').close()
+    with project_lock(project_dir):
+        with pytest.raises(ProjectLockedError):
+            with project_lock(project_dir):
+                pass
+    assert not os.path.exists(lock_path(project_dir))
+
+
+def test_racing_takeovers_of_leftover_lock_never_overlap(tmp_path):
+    project_dir = str(tmp_path / "Race")
+    holders, peak, guard = [], [0], threading.Lock()
+
+    def contender(barrier):
+        barrier.wait()
+        try:
+            with project_lock(project_dir):
+                with guard:
+                    holders.append(1)
+                    peak[0] = max(peak[0], len(holders))
+                time.sleep(0.002)
+                with guard:
+                    holders.pop()
+        except ProjectLockedError:
+            pass
+
+    for _ in range(50):
+        open(lock_path(project_dir), 'w').close()  # the same leftover lock every round
+        barrier = threading.Barrier(8)
+        threads = [threading.Thread(target=contender, args=(barrier,)) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    assert peak[0] == 1
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="uses SIGKILL")
+def test_lock_of_killed_holder_is_released(tmp_path):
+    project_dir = str(tmp_path / "Killed")
+    holder = subprocess.Popen(
+        [sys.executable, '-c',
+         "import sys, time; from setup_project import project_lock\n"
+         f"with project_lock({project_dir!r}):\n    print('locked', flush=True); time.sleep(60)"],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))), stdout=subprocess.PIPE, text=True
+    )
+    assert holder.stdout.readline().strip() == 'locked'
+    with pytest.raises(ProjectLockedError):
+        with project_lock(project_dir):
+            pass
+    holder.send_signal(signal.SIGKILL)
+    holder.wait()
+    with project_lock(project_dir):  # the OS dropped the dead holder's lock
+        pass
+
+
+def test_existing_project_is_not_overwritten_by_default(tmp_path):
+    scaffold_project("Stress0", output_dir=str(tmp_path), **STRESS_OPTIONS)
+    (tmp_path / "Stress0" / "main.py").write_text("# my edits\n")
+    with pytest.raises(ProjectExistsError):
+        scaffold_project("Stress0", output_dir=str(tmp_path), **STRESS_OPTIONS)
+    assert (tmp_path / "Stress0" / "main.py").read_text() == "# my edits\n"
+    scaffold_project("Stress0", output_dir=str(tmp_path), overwrite=True, **STRESS_OPTIONS)
+    assert verify_project(str(tmp_path / "Stress0"), "Stress0") == []
+
+
+def test_lock_of_output_folder_named_after_project_is_beside_it(tmp_path):
+    output_dir = tmp_path / "Stress0"
+    output_dir.mkdir()
+    with project_lock(str(output_dir)) as path:
+        assert path == lock_path(str(output_dir)) == str(tmp_path / ".Stress0.scaffold.lock")
+        with pytest.raises(ProjectLockedError):
+            scaffold_project("Stress0", output_dir=str(output_dir), **STRESS_OPTIONS)
+    scaffold_project("Stress0", output_dir=str(output_dir), **STRESS_OPTIONS)
+    assert (output_dir / "main.py").is_file()
+    assert not os.path.exists(lock_path(str(output_dir)))
+
+
+def test_verify_project_detects_missing_and_foreign_files(tmp_path):
+    scaffold_project("Stress1", output_dir=str(tmp_path), **STRESS_OPTIONS)
+    project_dir = tmp_path / "Stress1"
+    (project_dir / "README.md").write_text("# Stress2\n")
+    os.remove(project_dir / "LICENSE")
+    assert verify_project(str(project_dir), "Stress1") == ["missing LICENSE"]
+    (project_dir / "LICENSE").write_text("MIT")
+    assert verify_project(str(project_dir), "Stress1") == ["README.md belongs to another project"]
+
+
+@pytest.mark.parametrize('mode', ['thread', 'process'])
+@pytest.mark.parametrize('distinct', [None, 3])
+def test_concurrent_scaffolds_are_complete(tmp_path, mode, distinct):
+    result = run_stress(str(tmp_path / "out"), count=40, workers=8, mode=mode, distinct=distinct)
+    assert result['failed'] == []
+    assert result['incomplete'] == {}
+    assert result['succeeded'] + result['locked'] + result['exists'] == 40
+    # each name is written exactly once; every other scaffold of it fails cleanly
+    assert result['succeeded'] == (distinct or 40)
+    assert result['projects_per_sec'] > 0
+    assert result['p50'] <= result['p99'] <= result['max']
+    assert not [n for n in os.listdir(tmp_path / "out") if n.endswith('.scaffold.lock')]
+    assert "projects/s" in format_stress_report(result)
+
+
+def test_thread_stress_restores_telemetry_path(tmp_path):
+    path = telemetry.TELEMETRY_PATH
+    run_stress(str(tmp_path / "out"), count=4, workers=2, mode='thread')
+    assert telemetry.TELEMETRY_PATH == path
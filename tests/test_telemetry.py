@@ -0,0 +1,99 @@
+import pytest
+
+import telemetry
+from telemetry import track, load_records, percentile, is_regression, summarize, find_regressions
+
+
+def test_track_appends_structured_record():
+    with track('package', {'exe_name': 'demo'}) as record:
+        record.subprocesses += 2
+        record.bytes_written = 1234
+
+    [entry] = load_records()
+    assert entry['operation'] == 'package'
+    assert entry['options'] == {'exe_name': 'demo'}
+    assert entry['subprocesses'] == 2
+    assert entry['bytes_written'] == 1234
+    assert entry['exit_code'] == 0
+    assert entry['duration'] >= 0
+
+
+def test_track_records_failures_and_reraises():
+    with pytest.raises(RuntimeError):
+        with track('scaffold'):
+            raise RuntimeError("disk full")
+
+    [entry] = load_records('scaffold')
+    assert entry['exit_code'] == 1
+    assert entry['error'] == "disk full"
+
+
+def test_load_records_skips_corrupt_lines():
+    with open(telemetry.TELEMETRY_PATH, 'w') as f:
+        f.write('{"operation": "a", "duration": 1, "exit_code": 0}\nnot json\n')
+    assert [r['operation'] for r in load_records()] == ['a']
+
+
+def test_percentile():
+    assert percentile([], 50) is None
+    assert percentile([3, 1, 2], 50) == 2
+    assert percentile([0, 10], 90) == pytest.approx(9)
+
+
+def history(*durations, op='package'):
+    return [{'operation': op, 'duration': d, 'exit_code': 0, 'started_at': i}
+            for i, d in enumerate(durations)]
+
+
+def test_is_regression_needs_history():
+    assert not is_regression(100, history(1, 1, 1))
+    assert is_regression(100, history(1, 1, 1, 1, 1))
+    assert not is_regression(1.5, history(1, 1, 1, 1, 1))
+
+
+def test_summarize_and_find_regressions():
+    records = history(1, 1, 1, 1, 1, 10) + history(5, op='scaffold')
+    records.append({'operation': 'scaffold', 'duration': 0.1, 'exit_code': 1, 'started_at': 9})
+
+    rows = {row['operation']: row for row in summarize(records)}
+    assert rows['package']['runs'] == 6
+    assert rows['package']['p50'] == 1
+    assert rows['package']['last'] == 10
+    assert rows['scaffold']['failures'] == 1
+
+    assert [r['duration'] for r in find_regressions(records)] == [10]
+
+
+def test_track_flags_slow_run(monkeypatch):
+    for entry in history(1, 1, 1, 1, 1):
+        telemetry.append_record(entry)
+    clock = iter([0.0, 50.0])
+    monkeypatch.setattr(telemetry.time, 'monotonic', lambda: next(clock))
+    with track('package') as record:
+        pass
+    assert record.regression
+
+
+def test_history_is_compacted_per_operation(monkeypatch):
+    monkeypatch.setattr(telemetry, 'MAX_HISTORY_BYTES', 4000)
+    monkeypatch.setattr(telemetry, 'KEEP_PER_OPERATION', 5)
+    for i in range(100):
+        telemetry.append_record({'operation': 'watch_build', 'duration': i, 'exit_code': 0})
+        if i % 20 == 0:
+            telemetry.append_record({'operation': 'package', 'duration': i, 'exit_code': 0})
+    records = load_records()
+    builds = [r['duration'] for r in records if r['operation'] == 'watch_build']
+    # compacted to the newest 5, then appended to again until the next compaction
+    assert builds[:5] == sorted(builds[:5]) and builds[-1] == 99
+    assert len(builds) < 100
+    # a rarely used operation keeps its own history
+    assert [r['duration'] for r in records if r['operation'] == 'package'] == [0, 20, 40, 60, 80]
+
+
+def test_recent_records_read_only_the_tail(monkeypatch):
+    monkeypatch.setattr(telemetry, 'RECENT_BYTES', 500)
+    for i in range(50):
+        telemetry.append_record({'operation': 'scaffold', 'duration': i, 'exit_code': 0})
+    recent = load_records('scaffold', recent=True)
+    assert 0 < len(recent) < 50
+    assert [r['duration'] for r in recent] == list(range(50 - len(recent), 50))
@@ -0,0 +1,106 @@
+import os
+import sys
+
+import pytest
+
+import template_copy
+from template_copy import copy_template, fast_copy, substitute
+from setup_project import scaffold_project
+
+
+@pytest.fixture
+def template(tmp_path):
+    root = tmp_path / "skeleton"
+    (root / "{{project_name}}" / "assets").mkdir(parents=True)
+    (root / "{{project_name}}" / "__init__.py").write_text('NAME = "{{project_name}}"\n')
+    (root / "{{project_name}}" / "assets" / "icon.png").write_bytes(b"\x89PNG{{project_name}}" + bytes(range(256)))
+    (root / "README.md").write_text("# {{ project_name }}\nby {{author}}, keeps {{unknown}}\n")
+    (root / "run.sh").write_text("#!/bin/sh\necho hi\n")
+    os.chmod(root / "run.sh", 0o755)
+    (root / "venv").mkdir()
+    (root / "venv" / "pyvenv.cfg").write_text("")
+    (root / "__pycache__").mkdir()
+    (root / "__pycache__" / "x.cpython-311.pyc").write_bytes(b"\0")
+    (root / "fixtures").mkdir()
+    (root / "fixtures" / "big.bin").write_bytes(os.urandom(1 << 20))
+    (root / "scratch.log").write_text("junk")
+    (root / ".scaffoldignore").write_text("# local files\n*.log\n")
+    return root
+
+
+def test_substitute_leaves_unknown_placeholders():
+    assert substitute("{{a}} {{ b }} {{c}}", {'a': 1, 'b': 'x'}) == "1 x {{c}}"
+
+
+def test_copy_template_substitutes_text_only(template, tmp_path):
+    dest = tmp_path / "Demo"
+    stats = copy_template(str(template), str(dest), {'project_name': 'Demo', 'author': 'Ann'})
+
+    assert (dest / "Demo" / "__init__.py").read_text() == 'NAME = "Demo"\n'
+    assert (dest / "README.md").read_text() == "# Demo\nby Ann, keeps {{unknown}}\n"
+    # binary assets are copied byte for byte, placeholders and all
+    assert (dest / "Demo" / "assets" / "icon.png").read_bytes() == \
+        (template / "{{project_name}}" / "assets" / "icon.png").read_bytes()
+    assert (dest / "fixtures" / "big.bin").read_bytes() == (template / "fixtures" / "big.bin").read_bytes()
+    assert os.access(dest / "run.sh", os.X_OK)
+    assert stats['files'] == 5
+    assert stats['substituted'] == 2
+
+
+def test_copy_template_skips_ignored_paths(template, tmp_path):
+    dest = tmp_path / "Demo"
+    copy_template(str(template), str(dest), {'project_name': 'Demo'})
+    for ignored in ("venv", "__pycache__", "scratch.log", ".scaffoldignore"):
+        assert not (dest / ignored).exists(), ignored
+
+
+def test_copy_template_hardlinks_assets(template, tmp_path):
+    dest = tmp_path / "Demo"
+    stats = copy_template(str(template), str(dest), {'project_name': 'Demo'}, hardlink_assets=True)
+    src_icon = template / "{{project_name}}" / "assets" / "icon.png"
+    assert os.path.samefile(dest / "Demo" / "assets" / "icon.png", src_icon)
+    assert stats['hardlink'] == 1
+    # non-asset binaries are still real copies
+    assert not os.path.samefile(dest / "fixtures" / "big.bin", template / "fixtures" / "big.bin")
+
+
+def test_mutable_assets_are_never_hardlinked(template, tmp_path):
+    (template / "fixtures" / "app.db").write_bytes(b"SQLite format 3\0")
+    (template / "fixtures" / "logo.svg").write_text("<svg/>")
+    dest = tmp_path / "Demo"
+    copy_template(str(template), str(dest), {'project_name': 'Demo'}, hardlink_assets=True)
+    for name in ("app.db", "logo.svg"):
+        assert not os.path.samefile(dest / "fixtures" / name, template / "fixtures" / name), name
+    # writing to the project's database leaves the template untouched
+    (dest / "fixtures" / "app.db").write_bytes(b"changed")
+    assert (template / "fixtures" / "app.db").read_bytes() == b"SQLite format 3\0"
+
+
+def test_fast_copy_falls_back_to_plain_copy(tmp_path, monkeypatch):
+    src = tmp_path / "a.bin"
+    src.write_bytes(b"data" * 1000)
+    monkeypatch.setattr(template_copy, '_reflink', lambda s, d: False)
+    monkeypatch.setattr(template_copy, '_kernel_copy', lambda s, d: False)
+    assert fast_copy(str(src), str(tmp_path / "b.bin")) == 'copy'
+    assert (tmp_path / "b.bin").read_bytes() == src.read_bytes()
+
+
+def test_copy_template_missing_folder(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        copy_template(str(tmp_path / "nope"), str(tmp_path / "out"))
+
+
+def test_scaffold_from_template_overrides_generated_files(template, tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, 'frozen', True, raising=False)  # skip venv creation
+    (template / "main.py").write_text("print('{{project_name}} from template')\n")
+    project_dir = scaffold_project(
+        project_name="TplApp", description="d", author="Ann", license_type="None",
+        gui_lib="tkinter", use_git=False, include_tests=True, include_ci=False,
+        include_docs=False, include_precommit=False, include_editorconfig=False,
+        use_src=False, output_dir=str(tmp_path / "out"), template_dir=str(template)
+    )
+    with open(os.path.join(project_dir, "main.py")) as f:
+        assert f.read() == "print('TplApp from template')\n"
+    assert os.path.isfile(os.path.join(project_dir, "TplApp", "assets", "icon.png"))
+    # generated files the template does not provide are kept
+    assert os.path.isfile(os.path.join(project_dir, "tests", "test_sample.py"))
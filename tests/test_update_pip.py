@@ -0,0 +1,23 @@
+import pytest
+
+import main
+from main import ScaffoldApp
+
+
+@pytest.mark.parametrize('exit_code, status, message', [
+    (0, (1.0, "Pip update complete"), "Pip update complete."),
+    (1, (0.0, "Pip update failed"), "Pip update failed (exit code 1)."),
+])
+def test_update_pip_reports_outcome(monkeypatch, exit_code, status, message):
+    monkeypatch.setattr(main.subprocess, 'Popen', lambda *a, **kw: object())
+    app = ScaffoldApp()  # __init__ is stubbed out in conftest
+    logs, progress = [], []
+    app._log = logs.append
+    app._set_progress = lambda fraction, text, eta=None: progress.append((fraction, text))
+    app._stream_process = lambda proc, parser, eta: exit_code
+    app._report_regression = lambda record: None
+
+    app._run_update_pip()
+
+    assert progress[-1] == status
+    assert logs[-1] == message
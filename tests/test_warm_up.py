@@ -0,0 +1,68 @@
+import os
+
+import pytest
+
+from setup_project import scaffold_project, warm_up_project
+
+
+def make_project(tmp_path, gui_lib='tkinter'):
+    return scaffold_project(
+        project_name="WarmApp", description="d", author="a", license_type="None",
+        gui_lib=gui_lib, use_git=False, include_tests=False, include_ci=False,
+        include_docs=False, include_precommit=False, include_editorconfig=False,
+        use_src=False, output_dir=str(tmp_path)
+    )
+
+
+def test_warm_up_compiles_and_times_import(tmp_path):
+    pytest.importorskip("tkinter")
+    project_dir = make_project(tmp_path)
+    report = warm_up_project(project_dir, 'tkinter')
+
+    assert report['error'] is None
+    assert report['skipped'] is None
+    assert report['compiled']
+    assert 0 <= report['import_time'] < 60
+    assert os.path.isdir(os.path.join(project_dir, '__pycache__'))
+    # venv/ is compiled through its own site-packages run, not as project source
+    assert not os.path.isdir(os.path.join(project_dir, 'venv', '__pycache__'))
+
+
+def test_warm_up_skips_import_without_toolkit(tmp_path):
+    # PyQt6 is not installed in the fresh venv, so the import probe is skipped, not failed
+    project_dir = make_project(tmp_path, gui_lib='pyqt6')
+    report = warm_up_project(project_dir, 'pyqt6')
+    assert report['error'] is None
+    assert report['compiled']
+    assert report['import_time'] is None
+    assert "PyQt6" in report['skipped']
+
+
+def test_warm_up_reports_failed_import(tmp_path):
+    # without a gui_lib there is no toolkit check, so the missing PyQt6 fails the import
+    project_dir = make_project(tmp_path, gui_lib='pyqt6')
+    report = warm_up_project(project_dir)
+    assert report['import_time'] is None
+    assert "PyQt6" in report['error']
+
+
+def test_warm_up_without_venv(tmp_path):
+    report = warm_up_project(str(tmp_path))
+    assert report == {'compiled': False, 'import_time': None, 'skipped': None,
+                      'error': "No project venv to warm up"}
+
+
+def test_warm_up_reports_hung_interpreter(tmp_path, monkeypatch):
+    import subprocess
+    from fleet_upgrade import venv_python
+    python = venv_python(str(tmp_path / "venv"))
+    os.makedirs(os.path.dirname(python))
+    open(python, 'w').close()
+
+    def hang(cmd, **kwargs):
+        raise subprocess.TimeoutExpired(cmd, kwargs.get('timeout'))
+
+    monkeypatch.setattr(subprocess, 'check_output', hang)
+    report = warm_up_project(str(tmp_path), timeout=1)
+    assert report['compiled'] is False
+    assert "timed out" in report['error']
@@ -0,0 +1,105 @@
+import os
+import sys
+import time
+import threading
+
+import pytest
+
+from watch_build import PollingWatcher, InotifyWatcher, WatchBuilder, make_watcher, pyinstaller_command
+
+
+def wait_for(predicate, timeout=15):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def test_pyinstaller_command_keeps_workpath():
+    cmd = pyinstaller_command('py', 'main.py', 'App', 'dist', workpath='build/w')
+    assert cmd[:3] == ['py', '-m', 'PyInstaller']
+    assert cmd[cmd.index('--workpath') + 1] == 'build/w'
+    assert '--clean' not in cmd
+    assert cmd[-1] == 'main.py'
+
+
+def test_polling_watcher_sees_changes_and_skips_ignored(tmp_path):
+    (tmp_path / "app.py").write_text("a")
+    (tmp_path / "build").mkdir()
+    watcher = PollingWatcher(str(tmp_path), ignore_paths=[str(tmp_path / "App.exe")])
+    (tmp_path / "app.py").write_text("changed")
+    (tmp_path / "new.py").write_text("new")
+    (tmp_path / "build" / "x.toc").write_text("ignored")
+    (tmp_path / "App.exe").write_text("ignored")
+    assert watcher.wait(0.01) == {str(tmp_path / "app.py"), str(tmp_path / "new.py")}
+    assert watcher.wait(0.01) == set()
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="inotify is Linux only")
+def test_inotify_watcher_follows_new_directories(tmp_path):
+    watcher = InotifyWatcher(str(tmp_path))
+    try:
+        (tmp_path / "pkg").mkdir()
+        assert str(tmp_path / "pkg") in watcher.wait(1)
+        (tmp_path / "pkg" / "mod.py").write_text("x")
+        assert wait_for(lambda: str(tmp_path / "pkg" / "mod.py") in watcher.wait(0.2))
+        (tmp_path / "__pycache__").mkdir()
+        (tmp_path / "__pycache__" / "mod.pyc").write_text("x")
+        assert watcher.wait(0.2) == set()
+    finally:
+        watcher.close()
+
+
+@pytest.mark.parametrize('polling', [True, False])
+def test_burst_of_saves_triggers_one_build(tmp_path, polling):
+    # watch a subfolder: the telemetry file written after each build lives in tmp_path
+    tmp_path = tmp_path / "src"
+    counter = tmp_path / "build" / "count.txt"
+    counter.parent.mkdir(parents=True)
+    script = f"open({str(counter)!r}, 'a').write('x')"
+    statuses = []
+    builder = WatchBuilder([sys.executable, '-c', script], str(tmp_path), debounce=0.8,
+                           on_status=statuses.append, polling=polling)
+    builder.start(build_now=False)
+    try:
+        for i in range(5):
+            (tmp_path / "app.py").write_text(f"v{i}")
+            time.sleep(0.1)
+        assert wait_for(lambda: builder.last_build is not None)
+        time.sleep(1.5)
+        assert counter.read_text() == "x"
+        assert any(s.startswith("Last build OK") for s in statuses)
+    finally:
+        builder.stop()
+
+
+def test_new_change_cancels_running_build(tmp_path):
+    tmp_path = tmp_path / "src"
+    marker = tmp_path / "build" / "finished.txt"
+    marker.parent.mkdir(parents=True)
+    script = f"import time, sys; time.sleep(float(sys.argv[1])); open({str(marker)!r}, 'a').write('x')"
+    statuses = []
+    lock = threading.Lock()
+
+    def on_status(text):
+        with lock:
+            statuses.append(text)
+
+    builder = WatchBuilder([sys.executable, '-c', script, '30'], str(tmp_path), debounce=0.2,
+                           on_status=on_status, polling=True)
+    builder.start()
+    try:
+        assert wait_for(lambda: "Building…" in statuses)
+        builder.command = [sys.executable, '-c', script, '0']
+        (tmp_path / "app.py").write_text("edit")
+        assert wait_for(lambda: builder.last_build is not None)
+        assert "Build cancelled (newer changes)" in statuses
+        assert marker.read_text() == "x"
+    finally:
+        builder.stop()
+
+
+def test_make_watcher_falls_back_to_polling(tmp_path):
+    assert isinstance(make_watcher(str(tmp_path), polling=True), PollingWatcher)
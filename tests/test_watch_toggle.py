@@ -0,0 +1,80 @@
+import time
+import threading
+
+import main
+from main import ScaffoldApp
+
+
+class FakeBuilder:
+    instances = []
+
+    def __init__(self, *args, **kwargs):
+        self.started = self.stopped = False
+        FakeBuilder.instances.append(self)
+
+    def start(self):
+        self.started = True
+
+    def stop(self):
+        self.stopped = True
+
+
+class FakeVar:
+    value = ""
+
+    def set(self, value):
+        self.value = value
+
+
+def make_app(monkeypatch, tmp_path):
+    FakeBuilder.instances = []
+    monkeypatch.setattr(main, 'WatchBuilder', FakeBuilder)
+    app = ScaffoldApp()  # __init__ is stubbed out in conftest
+    app.watcher = None
+    app.watch_pending = None
+    app._watch_lock = threading.Lock()
+    app.watch_status = FakeVar()
+    app.logs = []
+    app._log = app.logs.append
+    app._term_log = lambda line: None
+    app.after = lambda delay, fn, *args: fn(*args)
+    script = tmp_path / "main.py"
+    script.write_text("")
+    app._ask_package_target = lambda: (str(script), "app", str(tmp_path))
+    app.env_ready = threading.Event()
+    app._build_python = lambda entry_script, record=None: app.env_ready.wait(10) and "python"
+    return app
+
+
+def wait_for(predicate, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and not predicate():
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_second_click_while_starting_cancels(monkeypatch, tmp_path):
+    app = make_app(monkeypatch, tmp_path)
+    app._toggle_watch()
+    assert app.watch_pending is not None
+    app._toggle_watch()  # still preparing the build environment
+    assert "Watch mode cancelled before it started." in app.logs
+    app.env_ready.set()
+    # the start thread still builds its WatchBuilder, but must not start or keep it
+    assert wait_for(lambda: FakeBuilder.instances)
+    time.sleep(0.05)
+    assert app.watcher is None
+    assert not any(b.started for b in FakeBuilder.instances)
+
+
+def test_click_starts_then_stops_single_watcher(monkeypatch, tmp_path):
+    app = make_app(monkeypatch, tmp_path)
+    app.env_ready.set()
+    app._toggle_watch()
+    assert wait_for(lambda: app.watcher is not None)
+    assert app.watch_pending is None
+    assert app.watcher is FakeBuilder.instances[0] and app.watcher.started
+    app._toggle_watch()
+    assert app.watcher is None
+    assert FakeBuilder.instances[0].stopped
+    assert len(FakeBuilder.instances) == 1
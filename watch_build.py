@@ -0,0 +1,252 @@
+import os
+import sys
+import time
+import struct
+import select
+import threading
+import subprocess
+
+from telemetry import track
+
+
+# Folders whose changes never trigger a rebuild (build output, caches, environments)
+IGNORE_DIRS = {'.git', '__pycache__', 'build', 'dist', 'venv', '.venv', '.pytest_cache', '.mypy_cache'}
+
+# inotify constants from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+_WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+_EVENT = struct.Struct('iIII')
+
+
+def pyinstaller_command(python, entry_script, exe_name, dest_folder, workpath=None):
+    """The PyInstaller invocation used by the packager; workpath keeps the build cache between runs."""
+    cmd = [python, '-m', 'PyInstaller', '--onefile', '--windowed', '--noconfirm',
+           '--name', exe_name, '--distpath', dest_folder]
+    if workpath:
+        cmd += ['--workpath', workpath, '--specpath', workpath]
+    return cmd + [entry_script]
+
+
+def _ignored(path, root, ignore_paths):
+    rel = os.path.relpath(path, root)
+    if any(part in IGNORE_DIRS for part in rel.split(os.sep)):
+        return True
+    return any(path == p or path.startswith(p + os.sep) for p in ignore_paths)
+
+
+class PollingWatcher:
+    """Portable fallback: compare file mtimes/sizes between snapshots."""
+
+    def __init__(self, root, ignore_paths=()):
+        self.root = os.path.abspath(root)
+        self.ignore_paths = [os.path.abspath(p) for p in ignore_paths]
+        self._snapshot = self._scan()
+
+    def _scan(self):
+        snapshot = {}
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames
+                           if not _ignored(os.path.join(dirpath, d), self.root, self.ignore_paths)]
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                if _ignored(path, self.root, self.ignore_paths):
+                    continue
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                snapshot[path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def wait(self, timeout):
+        """Sleep for timeout seconds and return the set of paths that changed meanwhile."""
+        time.sleep(timeout)
+        current = self._scan()
+        old = self._snapshot
+        self._snapshot = current
+        return {p for p in old.keys() | current.keys() if old.get(p) != current.get(p)}
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify watcher (via libc), recursive over root; raises OSError when unavailable."""
+
+    def __init__(self, root, ignore_paths=()):
+        import ctypes
+        import ctypes.util
+        self.root = os.path.abspath(root)
+        self.ignore_paths = [os.path.abspath(p) for p in ignore_paths]
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs = {}
+        for dirpath, dirnames, _ in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames
+                           if not _ignored(os.path.join(dirpath, d), self.root, self.ignore_paths)]
+            self._add_watch(dirpath)
+
+    def _add_watch(self, path):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), _WATCH_MASK)
+        if wd >= 0:
+            self._dirs[wd] = path
+
+    def wait(self, timeout):
+        """Block up to timeout seconds and return the set of paths that changed."""
+        changed = set()
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return changed
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            wd, mask, _cookie, length = _EVENT.unpack_from(data, offset)
+            name = data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b'\0')
+            offset += _EVENT.size + length
+            if mask & IN_Q_OVERFLOW:
+                changed.add(self.root)
+                continue
+            parent = self._dirs.get(wd)
+            if parent is None:
+                continue
+            path = os.path.join(parent, os.fsdecode(name)) if name else parent
+            if _ignored(path, self.root, self.ignore_paths):
+                continue
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                self._add_watch(path)
+            changed.add(path)
+        return changed
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def make_watcher(root, ignore_paths=(), polling=False):
+    """Use inotify where the platform has it, polling everywhere else."""
+    if not polling and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(root, ignore_paths)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(root, ignore_paths)
+
+
+class WatchBuilder:
+    """
+    Rebuild whenever files under watch_dir change.
+
+    Bursts of saves are merged: a build starts only once no change has arrived for
+    `debounce` seconds. A change during a build cancels it and starts a fresh one.
+    on_status(text) and on_output(line) are called from background threads.
+    """
+
+    def __init__(self, command, watch_dir, debounce=0.5, cwd=None, ignore_paths=(),
+                 on_status=None, on_output=None, polling=False):
+        self.command = command
+        self.watch_dir = os.path.abspath(watch_dir)
+        self.debounce = debounce
+        self.cwd = cwd or self.watch_dir
+        self.ignore_paths = list(ignore_paths)
+        self.on_status = on_status or (lambda text: None)
+        self.on_output = on_output or (lambda line: None)
+        self.polling = polling
+        self.last_build = None  # (finished_at, duration, returncode)
+        self._lock = threading.Lock()
+        self._proc = None
+        self._generation = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self, build_now=True):
+        self._watcher = make_watcher(self.watch_dir, self.ignore_paths, self.polling)
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+        self.on_status(f"Watching {self.watch_dir}")
+        if build_now:
+            self._start_build()
+
+    def stop(self):
+        self._stop.set()
+        self._cancel_running()
+        if self._thread:
+            self._thread.join(timeout=5)
+        self._watcher.close()
+        self.on_status("Watch stopped")
+
+    def _loop(self):
+        while not self._stop.is_set():
+            changed = self._watcher.wait(0.5)
+            if not changed:
+                continue
+            # debounce: keep absorbing changes until the tree has been quiet for a while
+            quiet_until = time.monotonic() + self.debounce
+            while not self._stop.is_set():
+                remaining = quiet_until - time.monotonic()
+                if remaining <= 0:
+                    break
+                if self._watcher.wait(remaining):
+                    quiet_until = time.monotonic() + self.debounce
+            if not self._stop.is_set():
+                self._start_build()
+
+    def _cancel_running(self):
+        with self._lock:
+            proc = self._proc
+        if proc and proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+
+    def _start_build(self):
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+        self._cancel_running()
+        threading.Thread(target=self._build, args=(generation,), daemon=True).start()
+
+    def _build(self, generation):
+        with track('watch_build', {'command': self.command[-1]}) as record:
+            with self._lock:
+                if generation != self._generation or self._stop.is_set():
+                    record.exit_code = -1
+                    record.error = "superseded"
+                    return
+                self.on_status("Building…")
+                proc = subprocess.Popen(self.command, cwd=self.cwd, stdout=subprocess.PIPE,
+                                        stderr=subprocess.STDOUT, text=True)
+                self._proc = proc
+            record.subprocesses += 1
+            started = time.monotonic()
+            for line in proc.stdout:
+                self.on_output(line.rstrip())
+            proc.wait()
+            duration = time.monotonic() - started
+            record.exit_code = proc.returncode
+            if generation != self._generation or self._stop.is_set():
+                record.error = "cancelled"
+                self.on_status("Build cancelled (newer changes)")
+                return
+            self.last_build = (time.time(), duration, proc.returncode)
+            stamp = time.strftime('%H:%M:%S')
+            if proc.returncode == 0:
+                self.on_status(f"Last build OK at {stamp} ({duration:.1f}s)")
+            else:
+                self.on_status(f"Last build FAILED at {stamp} (exit code {proc.returncode})")